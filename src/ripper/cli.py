@@ -2,12 +2,15 @@
 
 import logging
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import typer
 
-from ripper.config.settings import Settings
-from ripper.core.ripper import RipCancelledError
+if TYPE_CHECKING:
+    from ripper.config.settings import Settings
+
+# Heavy imports (pydantic settings, ripper.core) are deferred to the
+# command bodies so `rip --help` and shell completion stay fast.
 
 app = typer.Typer(
     name="rip",
@@ -18,8 +21,14 @@ app = typer.Typer(
 logger = logging.getLogger(__name__)
 
 
-def _get_settings() -> Settings:
+def _get_settings() -> "Settings":
     """Load settings, warning on config errors."""
+    from ripper.config.settings import Settings
+
+    if Settings.is_unconfigured():
+        # Nothing to validate: field defaults are already well-typed.
+        return Settings.model_construct()
+
     try:
         return Settings()
     except Exception as e:
@@ -83,6 +92,7 @@ def movie(
     settings = _get_settings()
 
     from ripper.core.pipeline import setup_rip
+    from ripper.core.ripper import RipCancelledError
     from ripper.tui.flows import (
         cleanup_backup,
         rip_movie_full,
@@ -139,6 +149,7 @@ def multi(
     settings = _get_settings()
 
     from ripper.core.pipeline import setup_rip
+    from ripper.core.ripper import RipCancelledError
     from ripper.tui.flows import cleanup_backup, rip_multi_disc
 
     try:
@@ -185,6 +196,7 @@ def tv(
     settings = _get_settings()
 
     from ripper.core.pipeline import setup_rip
+    from ripper.core.ripper import RipCancelledError
     from ripper.tui.flows import cleanup_backup, rip_tv
 
     try:
@@ -1,6 +1,8 @@
 """Application settings with Pydantic validation and TOML/env var support."""
 
-import tomllib
+import logging
+import os
+import pickle
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -11,6 +13,50 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+from ripper.utils.atomic import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Set to any non-empty value to bypass the parsed-config cache.
+_NO_CONFIG_CACHE_ENV = "RIPPER_NO_CONFIG_CACHE"
+
+# Top-level TOML keys accepted without a section.
+_FLAT_KEYS = frozenset({
+    "tmdb_api_key",
+    "auto_lookup",
+    "fuzzy_threshold",
+    "discdb_enabled",
+    "staging_dir",
+    "movies_dir",
+    "tv_dir",
+    "device",
+    "auto_eject",
+    "min_main_length",
+    "min_extra_length",
+    "notify_terminal",
+    "notify_slack_webhook_url",
+    "theme",
+})
+
+# TOML section -> keys it may contain. Later keys win, so
+# [device].device overrides [device].path.
+_SECTION_KEYS: dict[str, tuple[str, ...]] = {
+    "metadata": (
+        "tmdb_api_key",
+        "auto_lookup",
+        "fuzzy_threshold",
+        "discdb_enabled",
+    ),
+    "paths": ("staging_dir", "movies_dir", "tv_dir"),
+    "device": ("path", "device", "auto_eject"),
+    "ripping": ("min_main_length", "min_extra_length"),
+    "notifications": ("notify_terminal", "notify_slack_webhook_url"),
+    "ui": ("theme",),
+}
+
+# Section keys whose setting has a different name.
+_SECTION_KEY_REMAP = {"path": "device"}
+
 
 class Settings(BaseSettings):
     """Ripper configuration loaded from env vars, TOML, or defaults."""
@@ -22,6 +68,9 @@ class Settings(BaseSettings):
     CONFIG_PATH: ClassVar[Path] = (
         Path.home() / ".config" / "ripper" / "config.toml"
     )
+    CONFIG_CACHE_PATH: ClassVar[Path] = (
+        Path.home() / ".cache" / "ripper" / "config.v1.pkl"
+    )
 
     # Metadata
     tmdb_api_key: str = ""
@@ -55,81 +104,65 @@ class Settings(BaseSettings):
     # UI
     theme: str = "dark"
 
+    @classmethod
+    def is_unconfigured(cls) -> bool:
+        """True when there is no config file and no RIPPER_* env var.
+
+        In that case Settings() would only validate the field defaults,
+        so callers can use model_construct() and skip validation.
+        """
+        if cls.CONFIG_PATH.exists():
+            return False
+        prefix = cls.model_config.get("env_prefix", "").upper()
+        return not any(key.upper().startswith(prefix) for key in os.environ)
+
     @classmethod
     def _load_toml_settings(cls) -> dict:
-        """Load config TOML and normalize nested sections."""
-        if not cls.CONFIG_PATH.exists():
+        """Load normalized config, reusing the pickled cache when fresh.
+
+        The cache is keyed on the config path, mtime and size, so any
+        edit to the TOML file invalidates it.
+        """
+        try:
+            stat = cls.CONFIG_PATH.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return {}
 
+        key = (str(cls.CONFIG_PATH), stat.st_mtime_ns, stat.st_size)
+        use_cache = not os.environ.get(_NO_CONFIG_CACHE_ENV)
+        if use_cache:
+            cached = _read_config_cache(cls.CONFIG_CACHE_PATH, key)
+            if cached is not None:
+                return cached
+
+        normalized = cls._parse_toml_settings()
+        if use_cache:
+            _write_config_cache(cls.CONFIG_CACHE_PATH, key, normalized)
+        return normalized
+
+    @classmethod
+    def _parse_toml_settings(cls) -> dict:
+        """Parse config TOML and normalize nested sections."""
+        import tomllib
+
         with cls.CONFIG_PATH.open("rb") as f:
             data = tomllib.load(f)
 
         if not isinstance(data, dict):
             return {}
 
-        flat_keys = {
-            "tmdb_api_key",
-            "auto_lookup",
-            "fuzzy_threshold",
-            "discdb_enabled",
-            "staging_dir",
-            "movies_dir",
-            "tv_dir",
-            "device",
-            "auto_eject",
-            "min_main_length",
-            "min_extra_length",
-            "notify_terminal",
-            "notify_slack_webhook_url",
-            "theme",
-        }
         normalized = {
             k: v
             for k, v in data.items()
-            if k in flat_keys and not isinstance(v, dict)
+            if k in _FLAT_KEYS and not isinstance(v, dict)
         }
-
-        metadata = data.get("metadata")
-        if isinstance(metadata, dict):
-            for key in (
-                "tmdb_api_key",
-                "auto_lookup",
-                "fuzzy_threshold",
-                "discdb_enabled",
-            ):
-                if key in metadata:
-                    normalized[key] = metadata[key]
-
-        paths = data.get("paths")
-        if isinstance(paths, dict):
-            for key in ("staging_dir", "movies_dir", "tv_dir"):
-                if key in paths:
-                    normalized[key] = paths[key]
-
-        device = data.get("device")
-        if isinstance(device, dict):
-            if "path" in device:
-                normalized["device"] = device["path"]
-            if "device" in device:
-                normalized["device"] = device["device"]
-            if "auto_eject" in device:
-                normalized["auto_eject"] = device["auto_eject"]
-
-        ripping = data.get("ripping")
-        if isinstance(ripping, dict):
-            for key in ("min_main_length", "min_extra_length"):
-                if key in ripping:
-                    normalized[key] = ripping[key]
-
-        notifications = data.get("notifications")
-        if isinstance(notifications, dict):
-            for key in ("notify_terminal", "notify_slack_webhook_url"):
-                if key in notifications:
-                    normalized[key] = notifications[key]
-
-        ui = data.get("ui")
-        if isinstance(ui, dict) and "theme" in ui:
-            normalized["theme"] = ui["theme"]
+        for section, keys in _SECTION_KEYS.items():
+            sub = data.get(section)
+            if not isinstance(sub, dict):
+                continue
+            for key in keys:
+                if key in sub:
+                    normalized[_SECTION_KEY_REMAP.get(key, key)] = sub[key]
 
         return normalized
 
@@ -144,3 +177,41 @@ class Settings(BaseSettings):
     ) -> tuple[Any, ...]:
         """Load from init kwargs, then env vars, then TOML file."""
         return (init_settings, env_settings, cls._load_toml_settings)
+
+
+def _read_config_cache(
+    cache_path: Path, key: tuple[str, int, int],
+) -> dict | None:
+    """Return the cached normalized config if its key matches."""
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug(
+            "Ignoring unreadable config cache %s", cache_path,
+            exc_info=True,
+        )
+        return None
+
+    if cached_key != key or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _write_config_cache(
+    cache_path: Path, key: tuple[str, int, int], data: dict,
+) -> None:
+    """Atomically write the normalized config cache."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            cache_path,
+            pickle.dumps((key, data), pickle.HIGHEST_PROTOCOL),
+        )
+    except OSError:
+        logger.debug(
+            "Could not write config cache %s", cache_path,
+            exc_info=True,
+        )
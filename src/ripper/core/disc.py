@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cached_property
 
 from ripper.utils.formatting import fmt_duration, fmt_size
 
@@ -51,12 +52,14 @@ class Title:
     matched_episode: tuple[int, int] | None = None  # (season, episode)
     discdb_info: DiscDbTitleInfo | None = None
 
-    @property
+    # Titles are not mutated after scanning, so the display strings are
+    # computed once per instance rather than on every table redraw.
+    @cached_property
     def duration_display(self) -> str:
         """Format duration as 'Xh XXm XXs'."""
         return fmt_duration(self.duration_seconds)
 
-    @property
+    @cached_property
     def size_display(self) -> str:
         """Format size as human-readable string."""
         return fmt_size(self.size_bytes)
@@ -1,6 +1,7 @@
 """File organization for Emby-compatible folder structures."""
 
 import logging
+import os
 import re
 import shutil
 import subprocess
@@ -40,20 +41,33 @@ class ReorganizeStagingResult:
 
 
 def find_mkv_files(root: Path) -> list[Path]:
-    """Return MKV files under root (recursive, case-insensitive), largest first."""
-    if not root.exists():
+    """Return MKV files under root (recursive, case-insensitive), largest first.
+
+    Walks the tree with a single os.scandir pass per directory and reads
+    each file's size from its DirEntry, so every file is stat'd once.
+    """
+    if not root.is_dir():
         return []
 
-    mkvs = [
-        path
-        for path in root.rglob("*")
-        if path.is_file() and path.suffix.lower() == ".mkv"
-    ]
-    return sorted(
-        mkvs,
-        key=lambda p: p.stat().st_size,
-        reverse=True,
-    )
+    sized: list[tuple[int, str]] = []
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (
+                        entry.name.lower().endswith(".mkv")
+                        and entry.is_file()
+                    ):
+                        sized.append((entry.stat().st_size, entry.path))
+        except OSError:
+            logger.warning("Could not scan %s", directory, exc_info=True)
+
+    sized.sort(key=lambda item: item[0], reverse=True)
+    return [Path(path) for _, path in sized]
 
 
 def reorganize_staging(
@@ -141,6 +155,7 @@ def organize_movie(
     extras_map: dict[Path, ExtraType] | None = None,
     main_mkv: Path | None = None,
     names_map: dict[Path, str] | None = None,
+    mkvs: list[Path] | None = None,
 ) -> Path:
     """Organize ripped files into Emby movie folder structure.
 
@@ -153,6 +168,8 @@ def organize_movie(
         main_mkv: Explicit main feature file. Falls back to largest.
         names_map: Optional mapping of file paths to display names
             (e.g. from DiscDB). Used to rename extras.
+        mkvs: Files to organize, largest first, as returned by the rip.
+            Falls back to listing staging_dir.
 
     Returns:
         Path to the organized movie directory.
@@ -160,7 +177,8 @@ def organize_movie(
     dest = settings.movies_dir / movie_name
     dest.mkdir(parents=True, exist_ok=True)
 
-    mkvs = find_mkv_files(staging_dir)
+    if mkvs is None:
+        mkvs = find_mkv_files(staging_dir)
     if not mkvs:
         raise FileNotFoundError(f"No MKV files found in {staging_dir}")
 
@@ -169,7 +187,7 @@ def organize_movie(
         main_mkv = mkvs[0]
     main_dest = dest / f"{movie_name}.mkv"
     logger.info("Main feature: %s -> %s", main_mkv.name, main_dest.name)
-    shutil.move(main_mkv, main_dest)
+    _fast_move(main_mkv, main_dest)
 
     # Organize extras
     extras = [m for m in mkvs if m != main_mkv]
@@ -190,7 +208,7 @@ def organize_movie(
             else sanitize_filename(extra.stem) + extra.suffix
         )
         logger.info("  -> %s/%s", extra_type.value, dest_name)
-        shutil.move(extra, extra_dir / dest_name)
+        _fast_move(extra, extra_dir / dest_name)
 
     # Clean up empty staging dir
     _remove_if_empty(staging_dir)
@@ -225,7 +243,7 @@ def organize_tv(
         ep_name = f"{show_name} - S{season_num:02d}E{ep_num:02d}.mkv"
         dest = season_dir / ep_name
         logger.info("  -> %s", ep_name)
-        shutil.move(mkv_path, dest)
+        _fast_move(mkv_path, dest)
 
     _remove_if_empty(staging_dir)
 
@@ -254,8 +272,7 @@ def organize_multi_disc(
     main_segments: list[Path] = []
     all_extras: list[Path] = []
 
-    for disc_dir in disc_dirs:
-        mkvs = find_mkv_files(disc_dir)
+    for disc_dir, mkvs in zip(disc_dirs, _list_disc_mkvs(disc_dirs)):
         if not mkvs:
             logger.warning("No MKV files in %s, skipping", disc_dir)
             continue
@@ -272,9 +289,9 @@ def organize_multi_disc(
         # Emby multi-part naming
         for i, seg in enumerate(main_segments, 1):
             part_name = f"{movie_name} - part{i}.mkv"
-            shutil.move(seg, dest / part_name)
+            _fast_move(seg, dest / part_name)
     else:
-        shutil.move(main_segments[0], dest / f"{movie_name}.mkv")
+        _fast_move(main_segments[0], dest / f"{movie_name}.mkv")
 
     # Organize extras from all discs
     if extras_map is None:
@@ -285,7 +302,7 @@ def organize_multi_disc(
         extra_dir = dest / extra_type.value
         extra_dir.mkdir(exist_ok=True)
         dest_name = sanitize_filename(extra.stem) + extra.suffix
-        shutil.move(extra, extra_dir / dest_name)
+        _fast_move(extra, extra_dir / dest_name)
 
     # Clean up disc staging dirs
     for disc_dir in disc_dirs:
@@ -295,49 +312,88 @@ def organize_multi_disc(
     return dest
 
 
+def _list_disc_mkvs(disc_dirs: list[Path]) -> list[list[Path]]:
+    """Run find_mkv_files over each disc dir, overlapping the directory I/O.
+
+    Results are returned in the same order as disc_dirs.
+    """
+    if len(disc_dirs) <= 1:
+        return [find_mkv_files(d) for d in disc_dirs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(disc_dirs), 4)) as pool:
+        return list(pool.map(find_mkv_files, disc_dirs))
+
+
 def _merge_segments(segments: list[Path], dest: Path, movie_name: str) -> None:
     """Merge MKV segments using mkvmerge."""
     if not shutil.which("mkvmerge"):
         logger.warning("mkvmerge not found, falling back to multi-part naming")
         for i, seg in enumerate(segments, 1):
-            shutil.move(seg, dest / f"{movie_name} - part{i}.mkv")
+            _fast_move(seg, dest / f"{movie_name} - part{i}.mkv")
         return
 
     output = dest / f"{movie_name}.mkv"
-    cmd = ["mkvmerge", "-o", str(output), str(segments[0])]
-    for seg in segments[1:]:
-        cmd.extend(["+", str(seg)])
+    # --quiet drops the continuous "Progress: N%" output; mkvmerge still
+    # reports errors and warnings, which it writes to stdout.
+    cmd = [
+        "mkvmerge", "--quiet", "-o", str(output), str(segments[0]),
+        *(arg for seg in segments[1:] for arg in ("+", str(seg))),
+    ]
 
     logger.info("Merging %d segments with mkvmerge...", len(segments))
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
 
     if result.returncode == 0:
         logger.info("Merge complete: %s", output.name)
         for seg in segments:
             seg.unlink()
     else:
-        logger.error("mkvmerge failed: %s", result.stderr)
+        logger.error("mkvmerge failed: %s", result.stdout)
         logger.warning("Falling back to multi-part naming")
         for i, seg in enumerate(segments, 1):
-            shutil.move(seg, dest / f"{movie_name} - part{i}.mkv")
+            _fast_move(seg, dest / f"{movie_name} - part{i}.mkv")
+
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move a file with a bare os.rename, skipping shutil.move's checks.
+
+    Any rename failure (EXDEV across devices, EPERM or EACCES on some
+    network mounts) is retried through shutil.move, which copies.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+def _is_empty_dir(path: Path) -> bool:
+    """Return True if path is a directory with no entries.
+
+    Reads at most one entry instead of listing the whole directory.
+    """
+    with os.scandir(path) as it:
+        return next(it, None) is None
 
 
 def _remove_if_empty(path: Path) -> None:
     """Remove path and any empty subdirectories beneath it."""
     try:
-        if not path.is_dir():
-            return
-
         # Remove nested empty directories first, then the root.
         for subdir in sorted(
             (p for p in path.rglob("*") if p.is_dir()),
             key=lambda p: len(p.parts),
             reverse=True,
         ):
-            if not any(subdir.iterdir()):
-                subdir.rmdir()
+            if _is_empty_dir(subdir):
+                os.rmdir(subdir)
 
-        if not any(path.iterdir()):
-            path.rmdir()
+        if _is_empty_dir(path):
+            os.rmdir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
     except OSError:
         logger.warning("Could not remove directory %s", path, exc_info=True)
@@ -4,7 +4,6 @@ import json
 import logging
 import os
 import re
-import shutil
 import subprocess
 import threading
 import time
@@ -16,17 +15,33 @@ from typing import TextIO
 
 from ripper.config.settings import Settings
 from ripper.core.disc import Title
-from ripper.core.scanner import MakeMKVNotFoundError
+from ripper.core.scanner import makemkvcon_path
 
 logger = logging.getLogger(__name__)
 
 _PROGRESS_DEBUG_ENV = "RIPPER_PROGRESS_DEBUG"
 _PROGRESS_DEBUG_FILE_ENV = "RIPPER_PROGRESS_DEBUG_FILE"
 
+# Read buffer for the makemkvcon PTY master
+_PTY_READ_BUFFER = 1 << 16
 
-@dataclass
+# Minimum seconds between on_progress callbacks (caps delivery at 10 Hz)
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# Seconds to wait after SIGTERM before escalating to SIGKILL
+_CANCEL_TIMEOUT = 5.0
+
+# Minimum seconds between ETA recalculations; callers only need ~1 Hz
+_ETA_MIN_INTERVAL = 0.5
+
+
+@dataclass(slots=True, frozen=True)
 class RipProgress:
-    """Progress update from a rip operation."""
+    """Progress update from a rip operation.
+
+    One is built per parsed progress line, so the class uses slots and
+    is immutable; it is safe to hand across the reader thread.
+    """
 
     title_id: int
     title_name: str
@@ -39,10 +54,8 @@ class RipProgress:
 
 ProgressCallback = Callable[[RipProgress], None]
 
-# makemkvcon progress line pattern: PRGV:current,total,max
-PROGRESS_RE = re.compile(r"^PRGV:(\d+),(\d+),(\d+)")
-# Current title being processed: PRGC:id,code,"name"
-CURRENT_TITLE_RE = re.compile(r'^PRGC:(\d+),\d+,"(.*)"')
+# makemkvcon progress lines PRGV:current,total,max and
+# PRGC:id,code,"name" are parsed on the hot path with _split_prg_fields.
 # Human-readable progress title: PRGT:cur,total,"message"
 PROGRESS_TITLE_RE = re.compile(r'^PRGT:\d+,\d+,"(.*)"')
 # Human-readable fallback from non-robot output:
@@ -76,6 +89,8 @@ class _ProgressDebugHarness:
         self._start_time = time.monotonic()
         self._seq = 0
         self._write_failed = False
+        # Written from both the PTY reader thread and the caller's thread
+        self._lock = threading.Lock()
 
     @classmethod
     def from_environment(
@@ -109,28 +124,30 @@ class _ProgressDebugHarness:
 
     def record(self, event: str, **payload: object) -> None:
         """Write one JSON event; degrade gracefully on write failures."""
-        if self._write_failed:
-            return
-
-        self._seq += 1
-        row = {
-            "seq": self._seq,
-            "event": event,
-            "elapsed_ms": int(
-                (time.monotonic() - self._start_time) * 1000
-            ),
-            **payload,
-        }
-        try:
-            self._stream.write(json.dumps(row, ensure_ascii=True))
-            self._stream.write("\n")
-            self._stream.flush()
-        except OSError:
-            self._write_failed = True
-            logger.warning(
-                "Progress debug trace write failed for %s",
-                self.path,
-            )
+        with self._lock:
+            if self._write_failed:
+                return
+
+            self._seq += 1
+            row = {
+                "seq": self._seq,
+                "event": event,
+                "elapsed_ms": int(
+                    (time.monotonic() - self._start_time) * 1000
+                ),
+                **payload,
+            }
+            try:
+                self._stream.write(json.dumps(row, ensure_ascii=True))
+                self._stream.write("\n")
+                self._stream.flush()
+            except (OSError, ValueError):
+                # ValueError: stream already closed by close()
+                self._write_failed = True
+                logger.warning(
+                    "Progress debug trace write failed for %s",
+                    self.path,
+                )
 
     def close(self) -> None:
         try:
@@ -150,26 +167,36 @@ def cancel_rip(process_id: str) -> None:
     """Kill a specific makemkvcon process by ID."""
     with _process_lock:
         proc = _active_processes.get(process_id)
-        if proc and proc.poll() is None:
-            logger.info("Cancelling rip %s...", process_id)
-            proc.terminate()
-            try:
-                proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                proc.kill()
+    if proc:
+        _terminate_processes({process_id: proc})
 
 
 def cancel_all_rips() -> None:
     """Kill all tracked makemkvcon processes."""
     with _process_lock:
-        for pid, proc in list(_active_processes.items()):
-            if proc.poll() is None:
-                logger.info("Cancelling rip %s...", pid)
-                proc.terminate()
-                try:
-                    proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
+        procs = dict(_active_processes)
+    _terminate_processes(procs)
+
+
+def _terminate_processes(procs: dict[str, subprocess.Popen]) -> None:
+    """SIGTERM each live process, then SIGKILL any still alive after 5s.
+
+    Runs without _process_lock held, so a slow shutdown never blocks
+    registration or other cancels. All processes share one deadline.
+    """
+    pending: list[subprocess.Popen] = []
+    for pid, proc in procs.items():
+        if proc.poll() is None:
+            logger.info("Cancelling rip %s...", pid)
+            proc.terminate()
+            pending.append(proc)
+
+    deadline = time.monotonic() + _CANCEL_TIMEOUT
+    for proc in pending:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
 
 
 def cancel_active_rip() -> None:
@@ -207,7 +234,10 @@ def rip_all_titles(
     settings: Settings,
     on_progress: ProgressCallback | None = None,
 ) -> list[Path]:
-    """Rip all titles from disc to output directory."""
+    """Rip all titles from disc to output directory.
+
+    Returns the MKV files written by this rip, largest first.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     source = f"dev:{settings.device}"
@@ -222,9 +252,10 @@ def rip_all_titles(
     ]
 
     logger.info("Ripping all titles to %s", output_dir)
+    before = _snapshot_mkvs(output_dir)
     _run_makemkv(cmd, on_progress)
 
-    ripped = sorted(output_dir.glob("*.mkv"))
+    ripped = _written_mkvs(output_dir, before)
     logger.info("Rip complete: %d file(s)", len(ripped))
     return ripped
 
@@ -263,7 +294,10 @@ def remux_all_from_backup(
     on_progress: ProgressCallback | None = None,
     process_id: str | None = None,
 ) -> list[Path]:
-    """Remux all titles from a backup to MKV files."""
+    """Remux all titles from a backup to MKV files.
+
+    Returns the MKV files written by this remux, largest first.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     source = f"file:{backup_dir}"
@@ -278,9 +312,10 @@ def remux_all_from_backup(
     ]
 
     logger.info("Remuxing all titles from backup to %s", output_dir)
+    before = _snapshot_mkvs(output_dir)
     _run_makemkv(cmd, on_progress, process_id=process_id)
 
-    ripped = sorted(output_dir.glob("*.mkv"))
+    ripped = _written_mkvs(output_dir, before)
     logger.info("Remux complete: %d file(s)", len(ripped))
     return ripped
 
@@ -293,10 +328,14 @@ def remux_titles_from_backup(
     on_progress: ProgressCallback | None = None,
     process_id: str | None = None,
 ) -> list[Path]:
-    """Remux specific titles from a backup to MKV files."""
+    """Remux specific titles from a backup to MKV files.
+
+    Returns the MKV files written by this remux, largest first.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     source = f"file:{backup_dir}"
+    before = _snapshot_mkvs(output_dir)
     for title in titles:
         cmd = [
             "makemkvcon",
@@ -311,7 +350,7 @@ def remux_titles_from_backup(
             current_title=title, process_id=process_id,
         )
 
-    ripped = sorted(output_dir.glob("*.mkv"))
+    ripped = _written_mkvs(output_dir, before)
     logger.info("Remux complete: %d file(s)", len(ripped))
     return ripped
 
@@ -342,13 +381,44 @@ def _rip_single_title(
     if candidates:
         return candidates[0]
 
-    # Fallback: check for any new .mkv file
-    mkvs = sorted(
+    # Fallback: the most recently written .mkv file
+    return max(
         output_dir.glob("*.mkv"),
         key=lambda p: p.stat().st_mtime,
-        reverse=True,
+        default=None,
     )
-    return mkvs[0] if mkvs else None
+
+
+def _snapshot_mkvs(output_dir: Path) -> dict[str, tuple[int, int]]:
+    """Map each MKV name in output_dir to its (size, mtime_ns)."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                if entry.name.lower().endswith(".mkv") and entry.is_file():
+                    st = entry.stat()
+                    snapshot[entry.name] = (st.st_size, st.st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return snapshot
+
+
+def _written_mkvs(
+    output_dir: Path, before: dict[str, tuple[int, int]],
+) -> list[Path]:
+    """Return MKVs that are new or changed since before, largest first.
+
+    Files left over from an earlier, interrupted rip are skipped unless
+    makemkvcon overwrote them.
+    """
+    after = _snapshot_mkvs(output_dir)
+    written = [
+        (stat[0], name)
+        for name, stat in after.items()
+        if before.get(name) != stat
+    ]
+    written.sort(reverse=True)
+    return [output_dir / name for _, name in written]
 
 
 class _ProgressParser:
@@ -374,20 +444,33 @@ class _ProgressParser:
         self.last_rate: float | None = None
         self.sample_time: float | None = None
         self.sample_bytes: int | None = None
+        self._eta_at = float("-inf")
+        self._eta: int | None = None
         self._debug = debug_harness
 
     def parse_line(self, line: str) -> tuple[RipProgress, str] | None:
-        """Try each handler; return (progress, source) or None."""
-        result = (
-            self._try_progress_title(line)
-            or self._try_current_title(line)
-            or self._try_human_action(line)
-            or self._try_human_operation(line)
-            or self._try_prgv(line)
-            or self._try_human_progress(line)
-        )
+        """Dispatch on the line prefix; return (progress, source) or None.
+
+        Only PRG* and "Current ..." lines can match, so everything else
+        (MSG, TCOUNT, blank lines) is rejected without running a regex.
+        """
+        result: tuple[RipProgress, str] | None = None
+        if line.startswith("PRG"):
+            kind = line[3:4]
+            if kind == "V":
+                result = self._try_prgv(line)
+            elif kind == "C":
+                result = self._try_current_title(line)
+            elif kind == "T":
+                result = self._try_progress_title(line)
+        elif line.startswith("Current "):
+            result = (
+                self._try_human_progress(line)
+                or self._try_human_action(line)
+                or self._try_human_operation(line)
+            )
         if result is None and self._debug:
-            if line.startswith("PR") or line.startswith("Current "):
+            if line.startswith(("PR", "Current ")):
                 self._debug.record(
                     "unparsed_progress_line", line=line,
                 )
@@ -400,10 +483,21 @@ class _ProgressParser:
             percent=self.last_percent,
             current_bytes=self.last_current,
             total_bytes=self.last_total,
-            eta_seconds=_calc_eta(self.last_percent, self.start_time),
+            eta_seconds=self._throttled_eta(self.last_percent),
             bytes_per_second=self.last_rate,
         )
 
+    def _throttled_eta(
+        self, percent: float, now: float | None = None,
+    ) -> int | None:
+        """Return the ETA, recomputing it at most every _ETA_MIN_INTERVAL."""
+        if now is None:
+            now = time.monotonic()
+        if now - self._eta_at >= _ETA_MIN_INTERVAL:
+            self._eta = _calc_eta(percent, self.start_time, now)
+            self._eta_at = now
+        return self._eta
+
     def _try_progress_title(
         self, line: str,
     ) -> tuple[RipProgress, str] | None:
@@ -421,11 +515,20 @@ class _ProgressParser:
     def _try_current_title(
         self, line: str,
     ) -> tuple[RipProgress, str] | None:
-        m = CURRENT_TITLE_RE.match(line)
-        if not m:
+        fields = _split_prg_fields(line)
+        if fields is None:
+            return None
+        title_id, code, quoted = fields
+        if (
+            not (title_id.isascii() and title_id.isdigit())
+            or not (code.isascii() and code.isdigit())
+            or len(quoted) < 2
+            or quoted[0] != '"'
+            or quoted[-1] != '"'
+        ):
             return None
-        self.title_id = int(m.group(1))
-        self.title_name = m.group(2)
+        self.title_id = int(title_id)
+        self.title_name = quoted[1:-1]
         if self._debug:
             self._debug.record(
                 "line_parsed", kind="PRGC",
@@ -465,10 +568,14 @@ class _ProgressParser:
     def _try_prgv(
         self, line: str,
     ) -> tuple[RipProgress, str] | None:
-        m = PROGRESS_RE.match(line)
-        if not m:
+        fields = _split_prg_fields(line)
+        if fields is None or not all(
+            f.isascii() and f.isdigit() for f in fields
+        ):
             return None
-        current, maximum = _parse_progress_values(m)
+        current, maximum = _pick_progress_max(
+            int(fields[0]), int(fields[1]), int(fields[2]),
+        )
         percent = _clamp_percent(
             (current / maximum * 100) if maximum > 0 else 0
         )
@@ -500,7 +607,7 @@ class _ProgressParser:
             percent=percent,
             current_bytes=current,
             total_bytes=maximum,
-            eta_seconds=_calc_eta(percent, self.start_time),
+            eta_seconds=self._throttled_eta(percent, now),
             bytes_per_second=rate,
         )
         return progress, "PRGV"
@@ -531,7 +638,7 @@ class _ProgressParser:
             percent=percent,
             current_bytes=0,
             total_bytes=0,
-            eta_seconds=_calc_eta(percent, self.start_time),
+            eta_seconds=self._throttled_eta(percent),
             bytes_per_second=None,
         )
         return progress, "HUMAN_PROGRESS"
@@ -552,8 +659,8 @@ def _run_makemkv(
         process_id: Optional ID for the process registry. If None, a
             unique ID is generated automatically.
     """
-    if not shutil.which("makemkvcon"):
-        raise MakeMKVNotFoundError()
+    # Exec the cached absolute path instead of re-walking PATH per title
+    cmd = [makemkvcon_path(), *cmd[1:]]
 
     pid = process_id or _next_process_id()
 
@@ -579,33 +686,39 @@ def _run_makemkv(
 
     parser = _ProgressParser(current_title, debug_harness)
 
-    # Wrap the master fd in a buffered text reader for readline()
-    master_file = open(master_fd, closefd=True)  # noqa: SIM115
+    # Wrap the master fd in a buffered text reader for readline().
+    # A large buffer lets one read() drain a burst of progress lines.
+    master_file = open(  # noqa: SIM115
+        master_fd, buffering=_PTY_READ_BUFFER, closefd=True,
+    )
+
+    # Read the PTY on a dedicated thread so a slow on_progress callback
+    # (e.g. terminal rendering) never back-pressures makemkvcon.
+    mailbox = _ProgressMailbox()
+    reader = threading.Thread(
+        target=_drain_output,
+        args=(master_file, parser, mailbox, debug_harness),
+        name=f"makemkv-reader-{pid}",
+        daemon=True,
+    )
 
     return_code: int | None = None
     error_message: str | None = None
     try:
+        reader.start()
         while True:
-            try:
-                line = master_file.readline()
-            except OSError:
-                # PTY returns EIO when the slave side closes
-                break
-            if not line:
-                break
-            line = line.strip()
-            if debug_harness:
-                debug_harness.record("raw_line", line=line)
-
-            result = parser.parse_line(line)
-            if result:
-                progress, source = result
+            latest, closed = mailbox.take()
+            if latest:
+                progress, source = latest
                 _emit_progress_update(
                     progress,
                     source=source,
                     on_progress=on_progress,
                     debug_harness=debug_harness,
                 )
+            if closed:
+                break
+            time.sleep(_PROGRESS_MIN_INTERVAL)
 
         return_code = process.wait()
         if debug_harness:
@@ -624,9 +737,14 @@ def _run_makemkv(
         error_message = str(exc)
         raise
     finally:
-        master_file.close()
+        if process.poll() is None:
+            # Abandoned mid-rip (e.g. on_progress raised): stop makemkvcon
+            # so the reader hits EOF and closes the PTY
+            _terminate_processes({pid: process})
         with _process_lock:
             _active_processes.pop(pid, None)
+        if reader.is_alive():
+            reader.join(timeout=_CANCEL_TIMEOUT)
         if debug_harness:
             if error_message:
                 debug_harness.record(
@@ -637,11 +755,81 @@ def _run_makemkv(
             debug_harness.close()
 
 
-def _calc_eta(percent: float, start_time: float) -> int | None:
+class _ProgressMailbox:
+    """Single-slot handoff from the PTY reader thread to the caller.
+
+    Each parsed update carries the full progress state, so updates that
+    arrive between two takes are coalesced into the newest one.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._latest: tuple[RipProgress, str] | None = None
+        self._closed = False
+
+    def put(self, item: tuple[RipProgress, str]) -> None:
+        with self._cond:
+            self._latest = item
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def take(self) -> tuple[tuple[RipProgress, str] | None, bool]:
+        """Block until an update or EOF; return (latest, closed)."""
+        with self._cond:
+            while self._latest is None and not self._closed:
+                self._cond.wait()
+            latest, self._latest = self._latest, None
+            return latest, self._closed
+
+
+def _drain_output(
+    master_file: TextIO,
+    parser: _ProgressParser,
+    mailbox: _ProgressMailbox,
+    debug_harness: _ProgressDebugHarness | None,
+) -> None:
+    """Read makemkvcon output until EOF, posting parsed progress.
+
+    Owns master_file and closes it on exit, so the caller never closes
+    the PTY out from under a blocked readline().
+    """
+    try:
+        while True:
+            try:
+                line = master_file.readline()
+            except OSError:
+                # PTY returns EIO when the slave side closes
+                break
+            if not line:
+                break
+            # makemkvcon never left-pads; only the PTY's \r\n needs removing
+            line = line.rstrip()
+            if debug_harness:
+                debug_harness.record("raw_line", line=line)
+
+            result = parser.parse_line(line)
+            if result:
+                mailbox.put(result)
+    except Exception:
+        logger.warning("makemkvcon output reader failed", exc_info=True)
+    finally:
+        master_file.close()
+        mailbox.close()
+
+
+def _calc_eta(
+    percent: float, start_time: float, now: float | None = None,
+) -> int | None:
     """Estimate remaining seconds based on progress so far."""
     if percent <= 0:
         return None
-    elapsed = time.monotonic() - start_time
+    if now is None:
+        now = time.monotonic()
+    elapsed = now - start_time
     if elapsed < 2:
         return None
     total_estimated = elapsed / (percent / 100)
@@ -649,16 +837,14 @@ def _calc_eta(percent: float, start_time: float) -> int | None:
     return max(0, int(remaining))
 
 
-def _parse_progress_values(match: re.Match[str]) -> tuple[int, int]:
-    """Return (current, maximum) from a PRGV match.
+def _pick_progress_max(
+    first: int, second: int, third: int,
+) -> tuple[int, int]:
+    """Return (current, maximum) from the three PRGV fields.
 
     MakeMKV variants differ in which field carries max/total progress.
     Prefer a positive denominator and fall back to zero when unavailable.
     """
-    first = int(match.group(1))
-    second = int(match.group(2))
-    third = int(match.group(3))
-
     if third > 0:
         return first, third
     if second > 0:
@@ -666,6 +852,21 @@ def _parse_progress_values(match: re.Match[str]) -> tuple[int, int]:
     return first, 0
 
 
+def _split_prg_fields(line: str) -> list[str] | None:
+    """Split the three comma-separated fields of a PRGx: line.
+
+    PRGV and PRGC have a fixed shape, so a split is much cheaper than
+    a regex match on every progress line. The third field is left
+    intact because PRGC carries a quoted name that may contain commas.
+    """
+    if line[4:5] != ":":
+        return None
+    fields = line[5:].split(",", 2)
+    if len(fields) != 3:
+        return None
+    return fields
+
+
 def _parse_human_progress_values(match: re.Match[str]) -> float:
     """Return a normalized progress percent from human-readable output."""
     current_percent = int(match.group(1))
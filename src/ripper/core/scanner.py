@@ -1,10 +1,14 @@
 """Disc scanning using python-makemkv."""
 
+import functools
 import hashlib
 import logging
 import shutil
 import struct
 import subprocess
+import tempfile
+import threading
+from collections import defaultdict
 from pathlib import Path
 
 from ripper.config.settings import Settings
@@ -12,6 +16,27 @@ from ripper.core.disc import DiscInfo, Title
 
 logger = logging.getLogger(__name__)
 
+# Line prefixes _MakemkvInfo cares about; everything else is skipped
+_WANTED_PREFIXES = ("TINFO:", 'CINFO:2,0,"', "HSH:")
+# TINFO attribute code -> title_data key; codes not listed are skipped.
+# Code 10 is the text size ("32.1 GB"), only a fallback for code 11's
+# raw byte count (see _MakemkvInfo._add_title_info).
+_TINFO_FIELDS = {
+    2: "name",
+    8: "chapters",
+    9: "duration",
+    10: "size",
+    11: "size",
+    16: "source_file",
+    26: "segments_map",
+}
+
+# Seconds before a hung makemkvcon info scan is killed
+_SCAN_TIMEOUT = 300
+
+# Unit suffixes seen in formatted TINFO sizes ("32.1 GB")
+_SIZE_MULTIPLIERS = {"GB": 1_073_741_824, "MB": 1_048_576, "KB": 1024}
+
 
 class MakeMKVNotFoundError(RuntimeError):
     """Raised when makemkvcon is not installed."""
@@ -23,14 +48,30 @@ class MakeMKVNotFoundError(RuntimeError):
         )
 
 
+@functools.cache
+def makemkvcon_path() -> str:
+    """Return the absolute path to makemkvcon, resolved once per process.
+
+    Raises:
+        MakeMKVNotFoundError: If makemkvcon is not on PATH. Failures are
+            not cached, so installing MakeMKV mid-session is picked up.
+    """
+    path = shutil.which("makemkvcon")
+    if not path:
+        raise MakeMKVNotFoundError()
+    return path
+
+
 def _parse_duration(duration_str: str) -> int:
     """Parse 'H:MM:SS' into total seconds."""
-    parts = duration_str.split(":")
-    if len(parts) == 3:
-        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-    if len(parts) == 2:
-        return int(parts[0]) * 60 + int(parts[1])
-    return 0
+    try:
+        hours, minutes, seconds = duration_str.split(":")
+    except ValueError:
+        parts = duration_str.split(":")
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + int(parts[1])
+        return 0
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
 
 def _parse_raw_byte_count(size_str: str) -> int:
@@ -40,9 +81,11 @@ def _parse_raw_byte_count(size_str: str) -> int:
     formatted sizes ("32.1 GB", "500 MB").
     """
     s = size_str.strip()
+    # makemkvcon's TINFO code 11 is a plain integer; skip the suffix scan
+    if s.isascii() and s.isdigit():
+        return int(s)
     upper = s.upper()
-    multipliers = {"GB": 1_073_741_824, "MB": 1_048_576, "KB": 1024}
-    for suffix, mult in multipliers.items():
+    for suffix, mult in _SIZE_MULTIPLIERS.items():
         if upper.endswith(suffix):
             num_part = s[: -len(suffix)].strip()
             try:
@@ -67,8 +110,7 @@ def scan_disc(
         MakeMKVNotFoundError: If makemkvcon is not installed.
         RuntimeError: If scan fails or no titles found.
     """
-    if not shutil.which("makemkvcon"):
-        raise MakeMKVNotFoundError()
+    makemkvcon = makemkvcon_path()
 
     if backup_dir is not None:
         source = f"file:{backup_dir}"
@@ -77,22 +119,48 @@ def scan_disc(
         source = f"dev:{settings.device}"
         logger.info("Scanning disc at %s...", settings.device)
 
-    try:
-        result = subprocess.run(
-            ["makemkvcon", "-r", "info", source],
-            capture_output=True,
+    # Stream stdout so parsing overlaps with makemkvcon's disc reads.
+    # stderr goes to a temp file so a chatty stderr can never fill its
+    # pipe and stall the process while we block on stdout.
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        proc = subprocess.Popen(
+            [makemkvcon, "-r", "info", source],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
             text=True,
-            timeout=300,
         )
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("Disc scan timed out after 5 minutes")
+        timed_out = threading.Event()
 
-    if result.returncode != 0 and not result.stdout:
-        raise RuntimeError(
-            f"makemkvcon failed: {result.stderr.strip()}"
-        )
+        def _on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
 
-    return _parse_makemkv_output(result.stdout, settings)
+        timer = threading.Timer(_SCAN_TIMEOUT, _on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            assert proc.stdout is not None
+            with proc.stdout:
+                info = _MakemkvInfo()
+                for line in proc.stdout:
+                    info.feed(line.rstrip("\n"))
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+        if timed_out.is_set():
+            raise RuntimeError("Disc scan timed out after 5 minutes")
+
+        if returncode != 0 and not info.lines_seen:
+            stderr_file.seek(0)
+            raise RuntimeError(
+                f"makemkvcon failed: {stderr_file.read().strip()}"
+            )
+
+    return info.build(settings)
 
 
 def _compute_content_hash(hsh_sizes: list[int]) -> str:
@@ -138,93 +206,102 @@ def compute_hash_from_backup(backup_dir: Path) -> str | None:
 
 def _parse_makemkv_output(raw: str, settings: Settings) -> DiscInfo:
     """Parse raw makemkvcon output into DiscInfo."""
-    disc_name = "UNKNOWN_DISC"
-    title_data: dict[int, dict[str, str]] = {}
-    hsh_sizes: list[int] = []
-
+    info = _MakemkvInfo()
     for line in raw.splitlines():
-        # Disc name: CINFO:2,0,"name"
-        if line.startswith('CINFO:2,0,"'):
-            disc_name = line.split('"')[1]
-            continue
+        info.feed(line)
+    return info.build(settings)
 
-        # HSH line: HSH:{index},{filename},{datetime},{size}
-        if line.startswith("HSH:"):
-            parts = line[4:].split(",")
-            if len(parts) >= 4:
-                try:
-                    hsh_sizes.append(int(parts[3]))
-                except ValueError:
-                    pass
-            continue
 
-        # Title info: TINFO:title_id,code,subcode,"value"
-        if not line.startswith("TINFO:"):
-            continue
+class _MakemkvInfo:
+    """Accumulates makemkvcon info output one line at a time."""
 
-        # Parse TINFO:N,code,subcode,"value"
-        try:
-            prefix, value_part = line.split(",", 1)
-            tid = int(prefix.split(":")[1])
-            parts = value_part.split(",", 2)
-            code = int(parts[0])
-            value = parts[2].strip('"')
-        except (ValueError, IndexError):
-            continue
-
-        if tid not in title_data:
-            title_data[tid] = {}
-
-        match code:
-            case 2:
-                title_data[tid]["name"] = value
-            case 8:
-                title_data[tid]["chapters"] = value
-            case 9:
-                title_data[tid]["duration"] = value
-            case 10:
-                # Text size (e.g. "32.1 GB") — only use as fallback
-                if "size" not in title_data[tid]:
-                    title_data[tid]["size"] = value
-            case 11:
-                # Raw byte count — always prefer over text size
-                title_data[tid]["size"] = value
-            case 16:
-                title_data[tid]["source_file"] = value
-            case 26:
-                title_data[tid]["segments_map"] = value
-
-    # Build Title objects
-    titles: list[Title] = []
-    for tid in sorted(title_data.keys()):
-        data = title_data[tid]
-        duration = _parse_duration(data.get("duration", "0:00:00"))
-
-        if duration < settings.min_extra_length:
-            continue
-
-        title = Title(
-            id=tid,
-            name=data.get("name", f"Title {tid}"),
-            duration_seconds=duration,
-            size_bytes=_parse_raw_byte_count(data.get("size", "0")),
-            chapter_count=int(data.get("chapters", "0")),
-            source_file=data.get("source_file", ""),
-            is_main_feature=duration >= settings.min_main_length,
-        )
-        titles.append(title)
+    def __init__(self) -> None:
+        self.disc_name = "UNKNOWN_DISC"
+        self.title_data: defaultdict[int, dict[str, str]] = defaultdict(dict)
+        self.hsh_sizes: list[int] = []
+        self.lines_seen = 0
 
-    if not titles:
-        raise RuntimeError("No rippable titles found on disc")
+    def feed(self, line: str) -> None:
+        """Parse one line of makemkvcon -r info output."""
+        self.lines_seen += 1
 
-    content_hash = _compute_content_hash(hsh_sizes)
+        # Most output is SINFO/MSG/DRV; reject it with a single C call
+        if not line.startswith(_WANTED_PREFIXES):
+            return
 
-    logger.info(
-        "Found %d title(s) on disc '%s'", len(titles), disc_name
-    )
-    return DiscInfo(
-        name=disc_name,
-        device=settings.device,
-        titles=titles,
-        content_hash=content_hash or None,
-    )
+        # Title info: TINFO:title_id,code,subcode,"value"
+        if line.startswith("TINFO:"):
+            try:
+                prefix, code_str, _subcode, value = line.split(",", 3)
+                code = int(code_str)
+                field = _TINFO_FIELDS.get(code)
+                if field is None:
+                    return
+                tid = int(prefix[6:])
+            except ValueError:
+                return
+            self._add_title_info(tid, code, field, value.strip('"'))
+            return
+
+        # Disc name: CINFO:2,0,"name"
+        if line.startswith('CINFO:2,0,"'):
+            self.disc_name = line.split('"')[1]
+            return
+
+        # HSH line: HSH:{index},{filename},{datetime},{size}
+        parts = line[4:].split(",")
+        if len(parts) >= 4:
+            try:
+                self.hsh_sizes.append(int(parts[3]))
+            except ValueError:
+                pass
+
+    def _add_title_info(
+        self, tid: int, code: int, field: str, value: str
+    ) -> None:
+        """Store one TINFO attribute for title tid."""
+        if code == 10:
+            # Text size (e.g. "32.1 GB") — only use as fallback
+            self.title_data[tid].setdefault(field, value)
+        else:
+            self.title_data[tid][field] = value
+
+    def build(self, settings: Settings) -> DiscInfo:
+        """Build DiscInfo from everything fed so far.
+
+        Raises:
+            RuntimeError: If no title passes min_extra_length.
+        """
+        titles: list[Title] = []
+        for tid in sorted(self.title_data.keys()):
+            data = self.title_data[tid]
+            duration = _parse_duration(data.get("duration", "0:00:00"))
+
+            if duration < settings.min_extra_length:
+                continue
+
+            title = Title(
+                id=tid,
+                name=data.get("name", f"Title {tid}"),
+                duration_seconds=duration,
+                size_bytes=_parse_raw_byte_count(data.get("size", "0")),
+                chapter_count=int(data.get("chapters", "0")),
+                source_file=data.get("source_file", ""),
+                is_main_feature=duration >= settings.min_main_length,
+            )
+            titles.append(title)
+
+        if not titles:
+            raise RuntimeError("No rippable titles found on disc")
+
+        content_hash = _compute_content_hash(self.hsh_sizes)
+
+        logger.info(
+            "Found %d title(s) on disc '%s'", len(titles), self.disc_name
+        )
+        return DiscInfo(
+            name=self.disc_name,
+            device=settings.device,
+            titles=titles,
+            content_hash=content_hash or None,
+        )
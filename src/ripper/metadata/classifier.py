@@ -1,5 +1,6 @@
 """Classify disc titles as main features, extras types, or TV episodes."""
 
+import functools
 import logging
 import re
 
@@ -46,15 +47,32 @@ EXTRA_PATTERNS: list[tuple[re.Pattern[str], ExtraType]] = [
 ]
 
 
+# All EXTRA_PATTERNS folded into one regex. Each pattern sits in its own
+# lookahead, tried in list order at position 0, so the first pattern that
+# matches anywhere wins (not the leftmost match in the string).
+_EXTRA_RE = re.compile(
+    "|".join(
+        rf"(?=[\s\S]*?(?P<g{i}>{pattern.pattern}))"
+        for i, (pattern, _) in enumerate(EXTRA_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+_EXTRA_GROUP_TYPES = {
+    f"g{i}": extra_type for i, (_, extra_type) in enumerate(EXTRA_PATTERNS)
+}
+
+
+@functools.lru_cache(maxsize=512)
 def classify_extra(title_name: str) -> ExtraType:
     """Classify an extra by its title name using pattern matching.
 
-    Returns the best matching ExtraType, or EXTRAS as fallback.
+    Returns the best matching ExtraType, or EXTRAS as fallback. Cached:
+    multi-disc sets and backup re-scans repeat the same names.
     """
-    for pattern, extra_type in EXTRA_PATTERNS:
-        if pattern.search(title_name):
-            return extra_type
-    return ExtraType.EXTRAS
+    m = _EXTRA_RE.match(title_name)
+    if m is None:
+        return ExtraType.EXTRAS
+    return _EXTRA_GROUP_TYPES[m.lastgroup]  # type: ignore[index]
 
 
 def classify_titles(titles: list[Title], min_main_length: int = 3600) -> None:
@@ -174,19 +192,50 @@ def detect_media_type(
         if discdb_type in discdb_map:
             return discdb_map[discdb_type]
 
-    long_titles = [t for t in titles if t.duration_seconds >= min_main_length]
-    medium_titles = [t for t in titles if 1200 <= t.duration_seconds < min_main_length]
+    n_long = n_medium = 0
+    for t in titles:
+        duration = t.duration_seconds
+        if duration >= min_main_length:
+            n_long += 1
+        elif duration >= 1200:
+            n_medium += 1
+    return _media_type_from_counts(n_long, n_medium)
+
+
+def classify_and_detect(
+    titles: list[Title], min_main_length: int = 3600
+) -> MediaType:
+    """Classify titles in-place and return the detected media type.
+
+    Same result as classify_titles followed by detect_media_type, but
+    walks the title list once.
+    """
+    n_long = n_medium = 0
+    for title in titles:
+        duration = title.duration_seconds
+        if duration >= min_main_length:
+            title.is_main_feature = True
+            n_long += 1
+        else:
+            title.is_main_feature = False
+            title.suggested_extra_type = classify_extra(title.name)
+            if duration >= 1200:
+                n_medium += 1
+    return _media_type_from_counts(n_long, n_medium)
+
 
+def _media_type_from_counts(n_long: int, n_medium: int) -> MediaType:
+    """Map long (feature-length) and medium (20 min+) title counts to a type."""
     # Single long title = movie
-    if len(long_titles) == 1:
+    if n_long == 1:
         return MediaType.MOVIE
 
     # Multiple long titles could be multi-feature disc
-    if len(long_titles) > 1:
+    if n_long > 1:
         return MediaType.MOVIE
 
     # Multiple medium-length titles (20-60 min) suggests TV episodes
-    if len(medium_titles) >= 3:
+    if n_medium >= 3:
         return MediaType.TV_SHOW
 
     return MediaType.UNKNOWN
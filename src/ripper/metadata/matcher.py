@@ -1,9 +1,11 @@
 """Fuzzy title matching for disc names against TMDb results."""
 
+import bisect
+import functools
 import logging
 import re
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process, utils
 
 logger = logging.getLogger(__name__)
 
@@ -22,19 +24,26 @@ DISC_NOISE_PATTERNS = [
     r"_DIRECTORS_CUT",
 ]
 
+# One pass over the name strips every noise pattern (tried in list order)
+_NOISE_RE = re.compile("|".join(DISC_NOISE_PATTERNS))
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+_WHITESPACE_RE = re.compile(r"\s+")
 
+
+@functools.lru_cache(maxsize=32)
 def clean_disc_name(disc_name: str) -> str:
     """Clean a raw disc name into a searchable title.
 
     Example: "DUNE_PART_TWO_DISC_1" -> "Dune Part Two"
+
+    Cached: the TUI cleans the same disc name on every scan, lookup and
+    name prompt.
     """
-    name = disc_name.upper()
-    for pattern in DISC_NOISE_PATTERNS:
-        name = re.sub(pattern, "", name)
+    name = _NOISE_RE.sub("", disc_name.upper())
 
     # Replace underscores and multiple spaces
-    name = name.replace("_", " ")
-    name = re.sub(r"\s+", " ", name).strip()
+    name = name.translate(_UNDERSCORE_TO_SPACE)
+    name = _WHITESPACE_RE.sub(" ", name).strip()
 
     # Title case
     return name.title()
@@ -61,16 +70,23 @@ def match_title(
     if not candidates:
         return None
 
+    # Score every candidate in one C++ call; ties keep the earliest.
+    # The query is normalized once (lowercase, punctuation stripped).
+    # WRatio, not token_set_ratio: the latter scores "Dune" 100 against
+    # "Dune Part Two" and cannot tell a film from its sequel.
+    titles, indices = _unique_titles(
+        [c.get(title_key, "") for c in candidates]
+    )
+    result = process.extractOne(
+        disc_name, titles,
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+    )
     best_match: dict | None = None
     best_score = 0
-
-    for candidate in candidates:
-        candidate_title = candidate.get(title_key, "")
-        score = fuzz.WRatio(disc_name, candidate_title)
-
-        if score > best_score:
-            best_score = score
-            best_match = candidate
+    if result is not None and result[1] > 0:
+        _, best_score, index = result
+        best_match = candidates[indices[index]]
 
     if best_score >= threshold and best_match is not None:
         logger.info(
@@ -90,6 +106,19 @@ def match_title(
     return None
 
 
+def _unique_titles(titles: list) -> tuple[list, list[int]]:
+    """Drop repeated titles so each distinct one is scored once.
+
+    Returns the distinct titles in first-seen order, plus the candidate
+    index each came from. Ties in extractOne keep the earliest choice,
+    so the chosen candidate is the same as scoring the full list.
+    """
+    first_index: dict = {}
+    for i, title in enumerate(titles):
+        first_index.setdefault(title, i)
+    return list(first_index), list(first_index.values())
+
+
 def match_episodes_by_duration(
     title_durations: list[tuple[int, int]],
     episode_runtimes: list[tuple[int, int]],
@@ -97,7 +126,8 @@ def match_episodes_by_duration(
 ) -> dict[int, int]:
     """Match disc titles to TV episodes by duration.
 
-    Uses greedy matching with tolerance window.
+    Uses greedy matching with tolerance window: longest titles first,
+    each taking the closest unused episode.
 
     Args:
         title_durations: List of (title_id, duration_seconds) from disc.
@@ -108,27 +138,40 @@ def match_episodes_by_duration(
         Dict mapping title_id -> episode_number.
     """
     matches: dict[int, int] = {}
-    used_episodes: set[int] = set()
 
-    # Sort titles by duration descending for better matching
+    # Available episodes as (runtime, input_index, episode_number), sorted
+    # ascending. Each title binary-searches for its nearest neighbours
+    # instead of scanning every episode; used episodes are removed.
+    available = sorted(
+        (ep_dur, i, ep_num)
+        for i, (ep_num, ep_dur) in enumerate(episode_runtimes)
+    )
+
+    # Longest titles pick first (stable for equal durations)
     sorted_titles = sorted(title_durations, key=lambda t: t[1], reverse=True)
-    sorted_episodes = sorted(episode_runtimes, key=lambda e: e[1], reverse=True)
 
     for title_id, title_dur in sorted_titles:
-        best_ep: int | None = None
-        best_diff = float("inf")
-
-        for ep_num, ep_dur in sorted_episodes:
-            if ep_num in used_episodes:
-                continue
-            diff = abs(title_dur - ep_dur)
-            if diff <= tolerance_seconds and diff < best_diff:
-                best_diff = diff
-                best_ep = ep_num
-
-        if best_ep is not None:
+        if not available:
+            break
+
+        # Closest runtime >= title: first entry of that runtime group
+        hi = bisect.bisect_left(available, (title_dur, -1))
+        # Closest runtime < title: also the first entry of its group
+        lo = None
+        if hi > 0:
+            lo = bisect.bisect_left(available, (available[hi - 1][0], -1))
+
+        # On equal distance the longer episode wins
+        best_idx = None
+        best_diff = tolerance_seconds + 1
+        if hi < len(available):
+            best_idx, best_diff = hi, available[hi][0] - title_dur
+        if lo is not None and title_dur - available[lo][0] < best_diff:
+            best_idx, best_diff = lo, title_dur - available[lo][0]
+
+        if best_idx is not None and best_diff <= tolerance_seconds:
+            best_ep = available.pop(best_idx)[2]
             matches[title_id] = best_ep
-            used_episodes.add(best_ep)
             logger.info(
                 "Title %d matched to episode %d (diff: %ds)",
                 title_id,
@@ -1,24 +1,191 @@
 """TMDb API client for movie/TV metadata lookup."""
 
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 
 import aiohttp
 
+from ripper.utils.atomic import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 
+# One disc lookup makes several sequential calls to the same host; keep
+# the TLS connection alive between them rather than re-handshaking.
+_CONNECTOR_LIMIT = 10
+_CONNECTOR_LIMIT_PER_HOST = 5
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 60
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+_CACHE_MAX_ENTRIES = 256
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class _ResponseCache:
+    """Small TTL + LRU cache of successful TMDb responses.
+
+    With a path, live entries are read from a JSON file on first use and
+    written back by save(), which the owner calls once (at exit), so
+    re-running the same disc or series later skips the network too.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _CACHE_MAX_ENTRIES,
+        ttl_seconds: float = _CACHE_TTL_SECONDS,
+        path: Path | None = None,
+    ) -> None:
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self.path = path
+        self._loaded = False
+        self._dirty = False
+        # Shared by every TMDbClient, whichever thread or loop it runs on
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> dict | None:
+        self.load()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, data = entry
+            if time.time() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: tuple, data: dict) -> None:
+        self.load()
+        with self._lock:
+            self._entries[key] = (time.time(), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._dirty = True
+
+    def load(self) -> None:
+        """Read persisted entries once, dropping any that have expired.
+
+        Call it off the event loop (TMDbClient.__init__ does) so the
+        file read never blocks in-flight requests.
+        """
+        if self._loaded or self.path is None:
+            return
+        try:
+            raw = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raw = None
+        except OSError:
+            logger.debug(
+                "Could not read TMDb cache %s", self.path, exc_info=True,
+            )
+            raw = None
+        entries = _decode_entries(raw, time.time() - self._ttl) if raw else []
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            for key, entry in entries[-self._max_entries:]:
+                self._entries.setdefault(key, entry)
+
+    def save(self) -> None:
+        """Write entries to the JSON file if anything changed."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            entries = [
+                [_encode_key(key), stored_at, data]
+                for key, (stored_at, data) in self._entries.items()
+            ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(self.path, json.dumps(entries).encode())
+        except (OSError, TypeError, ValueError):
+            logger.debug(
+                "Could not write TMDb cache %s", self.path, exc_info=True,
+            )
+
+
+def _encode_key(key: tuple) -> list:
+    """JSON form of a cache key; the params frozenset becomes pairs."""
+    return [
+        sorted(map(list, part), key=lambda kv: kv[0])
+        if isinstance(part, frozenset) else part
+        for part in key
+    ]
+
+
+def _decode_key(parts: list) -> tuple:
+    return tuple(
+        frozenset(tuple(kv) for kv in part) if isinstance(part, list)
+        else part
+        for part in parts
+    )
+
+
+def _decode_entries(
+    raw: str, oldest: float,
+) -> list[tuple[tuple, tuple[float, dict]]]:
+    """Parse the cache file, keeping well-formed entries newer than oldest."""
+    decoded: dict[tuple, tuple[float, dict]] = {}
+    try:
+        for key, stored_at, data in json.loads(raw):
+            if (
+                isinstance(key, list)
+                and isinstance(data, dict)
+                and stored_at >= oldest
+            ):
+                decoded[_decode_key(key)] = (stored_at, data)
+    except (TypeError, ValueError):
+        logger.debug("Ignoring unreadable TMDb cache", exc_info=True)
+        return []
+    return list(decoded.items())
+
 
 class TMDbClient:
     """Async client for The Movie Database API."""
 
+    # Shared by all clients and persisted across runs: re-scans and
+    # re-rips of the same disc or series repeat the same requests.
+    cache = _ResponseCache(
+        path=Path.home() / ".cache" / "ripper" / "tmdb.v1.json",
+    )
+
     def __init__(self, api_key: str) -> None:
+        self.cache.load()
         self.api_key = api_key
+        self._auth_params = {"api_key": api_key}
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=_CONNECTOR_LIMIT,
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=_REQUEST_TIMEOUT,
+            )
         return self._session
 
     async def close(self) -> None:
@@ -63,19 +230,31 @@ class TMDbClient:
         return data.get(results_key, [])
 
     async def _get(self, endpoint: str, params: dict | None = None) -> dict:
-        """Make an authenticated GET request to TMDb."""
+        """Make an authenticated GET request to TMDb.
+
+        Successful responses are cached; errors are not.
+        """
+        cache_key = (endpoint, frozenset((params or {}).items()))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         session = await self._get_session()
         url = f"{TMDB_BASE_URL}/{endpoint}"
-        request_params = {"api_key": self.api_key}
-        if params:
-            request_params.update(params)
+        request_params = (
+            {**self._auth_params, **params} if params else self._auth_params
+        )
 
         try:
             async with session.get(url, params=request_params) as resp:
                 if resp.status != 200:
                     logger.error("TMDb API error: %d for %s", resp.status, endpoint)
                     return {}
-                return await resp.json()
-        except aiohttp.ClientError as e:
+                data = await resp.json()
+        except (aiohttp.ClientError, TimeoutError) as e:
             logger.error("TMDb request failed: %s", e)
             return {}
+
+        if isinstance(data, dict):
+            self.cache.put(cache_key, data)
+        return data
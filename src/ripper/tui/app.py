@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
 import shutil
-import threading
 from collections.abc import Sequence
+from concurrent.futures import Future, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,28 +16,27 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ripper.notifications import NotificationDispatcher
 
-from rich.console import Console
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
 from simple_term_menu import TerminalMenu
 
 from ripper.config.settings import Settings
-from ripper.core.disc import DiscInfo, MediaType
+from ripper.core.disc import DiscInfo, MediaType, Title
 from ripper.core.organizer import organize_movie, organize_tv
 from ripper.core.ripper import ProgressCallback, RipCancelledError, RipProgress
 from ripper.core.scanner import scan_disc
-from ripper.metadata.classifier import (
-    classify_titles,
-    detect_media_type,
-)
-from ripper.metadata.matcher import clean_disc_name
+from ripper.metadata.classifier import classify_and_detect
+from ripper.metadata.matcher import clean_disc_name, match_title
 from ripper.tui.display import (
     ConcurrentProgress,
+    console,
     print_progress,
     print_title_table,
     title_display_name,
 )
 from ripper.tui.flows import (
+    TMDB_LOOKUP_TIMEOUT,
     RemuxHandle,
     backup_is_valid,
     classify_and_organize_movie,
@@ -49,15 +49,15 @@ from ripper.tui.flows import (
     rip_selected,
     rip_tv,
     select_remux_titles,
+    shared_tmdb_client,
     start_remux_background,
 )
+from ripper.utils.aio import submit
 from ripper.utils.drive import eject_disc, wait_for_disc
 from ripper.utils.formatting import fmt_duration, fmt_size, sanitize_filename
 
 logger = logging.getLogger(__name__)
 
-console = Console()
-
 # Inputs that should return to the main menu from prompts.
 _BACK_COMMANDS = {"b", "back", "q", "quit"}
 
@@ -124,6 +124,11 @@ def run_interactive(
     if disc_info is None:
         return
 
+    # Kick off TMDb lookup in background — it only needs the disc name,
+    # so it runs behind the backup and will update disc_info before the
+    # user finishes navigating prompts
+    tmdb_lookup = _start_tmdb_lookup(disc_info, settings)
+
     # Create fresh backup if we don't have one yet
     if backup_dir is None:
         backup_dir = create_backup(settings, settings.staging_dir)
@@ -133,20 +138,14 @@ def run_interactive(
         # different indices to the same content.
         with console.status("  Indexing backup...", spinner="dots"):
             try:
-                disc_info = scan_disc(settings, backup_dir=backup_dir)
+                rescanned = scan_disc(settings, backup_dir=backup_dir)
             except Exception as e:
                 console.print(f"  [red]Backup scan failed: {e}[/]")
                 return
-            classify_titles(
-                disc_info.titles, settings.min_main_length
-            )
-            disc_info.detected_media_type = detect_media_type(
-                disc_info.titles, settings.min_main_length
+            rescanned.detected_media_type = classify_and_detect(
+                rescanned.titles, settings.min_main_length
             )
-
-    # Kick off TMDb lookup in background — will update disc_info
-    # before the user finishes navigating prompts
-    tmdb_thread = _start_tmdb_lookup(disc_info, settings)
+            _adopt_rescan(disc_info, rescanned)
 
     enrich_disc_info(disc_info, backup_dir, settings)
 
@@ -175,9 +174,11 @@ def run_interactive(
         if choice is None:
             break
 
-        # Wait for TMDb metadata before any flow that needs a name
+        # Wait for TMDb metadata before any flow that needs a name;
+        # it is applied once, later passes have nothing to wait for
         if choice != 5:
-            _await_tmdb(tmdb_thread)
+            _await_tmdb(tmdb_lookup, disc_info)
+            tmdb_lookup = None
 
         if choice == 0:
             _flow_movie(
@@ -204,7 +205,6 @@ def run_interactive(
                 dispatcher=dispatcher,
             )
         elif choice == 4:
-            _await_tmdb(tmdb_thread)
             _flow_select(
                 settings, disc_info,
                 backup_dir=backup_dir,
@@ -231,6 +231,13 @@ def run_interactive(
 # ── Scanning ─────────────────────────────────────────────────────────
 
 
+_MEDIA_LABELS = {
+    MediaType.MOVIE: "Movie",
+    MediaType.TV_SHOW: "TV Show",
+    MediaType.UNKNOWN: "Unknown",
+}
+
+
 def _scan_disc(
     settings: Settings, backup_dir: Path | None = None,
 ) -> DiscInfo | None:
@@ -243,17 +250,12 @@ def _scan_disc(
             console.print(f"  [red]Scan failed: {e}[/]")
             return None
 
-        classify_titles(disc_info.titles, settings.min_main_length)
-        disc_info.detected_media_type = detect_media_type(
+        disc_info.detected_media_type = classify_and_detect(
             disc_info.titles, settings.min_main_length
         )
 
     cleaned = clean_disc_name(disc_info.name)
-    media_label = {
-        MediaType.MOVIE: "Movie",
-        MediaType.TV_SHOW: "TV Show",
-        MediaType.UNKNOWN: "Unknown",
-    }[disc_info.detected_media_type]
+    media_label = _MEDIA_LABELS[disc_info.detected_media_type]
 
     main_count = len(disc_info.main_titles)
     extra_count = len(disc_info.extra_titles)
@@ -268,12 +270,23 @@ def _scan_disc(
         "Titles",
         f"{total} total ({main_count} main, {extra_count} extras)",
     )
-    console.print(Panel.fit(summary, border_style="cyan"))
-    console.print()
+    console.print(Group(Panel.fit(summary, border_style="cyan"), ""))
 
     return disc_info
 
 
+def _adopt_rescan(disc_info: DiscInfo, rescanned: DiscInfo) -> None:
+    """Move a backup re-scan's results onto disc_info in place.
+
+    Keeps the original object so a TMDb lookup already running against
+    it still lands its result there.
+    """
+    disc_info.name = rescanned.name
+    disc_info.titles = rescanned.titles
+    disc_info.content_hash = rescanned.content_hash
+    disc_info.detected_media_type = rescanned.detected_media_type
+
+
 def _show_disc_summary(
     disc_info: DiscInfo, verbose: bool = False,
 ) -> None:
@@ -289,70 +302,86 @@ def _show_disc_summary(
     console.print()
 
 
+# Seconds _await_tmdb waits silently before saying it is fetching
+_TMDB_QUIET_WAIT = 0.2
+
+
 def _start_tmdb_lookup(
     disc_info: DiscInfo, settings: Settings
-) -> threading.Thread | None:
-    """Start TMDb lookup in a background thread."""
+) -> Future[dict | None] | None:
+    """Start TMDb lookup on the shared background event loop.
+
+    The future resolves to the matched TMDb result (or None); it is
+    applied to disc_info by _await_tmdb on the caller's thread.
+    """
     if not settings.auto_lookup or not settings.tmdb_api_key:
         return None
 
     cleaned = clean_disc_name(disc_info.name)
+    client = shared_tmdb_client(settings.tmdb_api_key)
 
-    def _run() -> None:
-        from ripper.metadata.matcher import match_title
-        from ripper.metadata.tmdb import TMDbClient
-
-        async def _lookup() -> dict | None:
-            client = TMDbClient(settings.tmdb_api_key)
-            try:
-                results = await client.search_movie(cleaned)
-                return match_title(
-                    cleaned,
-                    results,
-                    threshold=settings.fuzzy_threshold,
-                )
-            finally:
-                await client.close()
-
+    async def _lookup() -> dict | None:
         try:
-            match = asyncio.run(_lookup())
+            results = await asyncio.wait_for(
+                client.search_movie(cleaned), TMDB_LOOKUP_TIMEOUT,
+            )
+        except TimeoutError:
+            logger.debug("TMDb lookup timed out for %r", cleaned)
+            return None
         except Exception:
             logger.debug("TMDb lookup failed", exc_info=True)
-            return
-
-        if match:
-            disc_info.tmdb_id = match.get("id")
-            title = match.get("title", "")
-            year = match.get("release_date", "")[:4]
-            disc_info.tmdb_title = title
-            if year:
-                disc_info.year = int(year)
+            return None
+        return match_title(
+            cleaned,
+            results,
+            threshold=settings.fuzzy_threshold,
+        )
 
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
-    return thread
+    return submit(_lookup())
 
 
-def _await_tmdb(thread: threading.Thread | None) -> bool:
-    """Wait for background TMDb lookup to finish.
+def _await_tmdb(
+    lookup: Future[dict | None] | None, disc_info: DiscInfo,
+) -> bool:
+    """Wait for background TMDb lookup to finish and apply its match.
 
-    Returns True if the thread completed, False if it timed out
+    Returns True if the lookup completed, False if it timed out
     (meaning disc_info may not have TMDb data populated).
     """
-    if thread is None:
+    if lookup is None:
         return True
-    if not thread.is_alive():
+    # A lookup that is about to land is waited out without a message
+    wait([lookup], timeout=_TMDB_QUIET_WAIT)
+    if not lookup.done():
+        console.print("  [dim]Fetching metadata...[/]")
+        remaining = max(TMDB_LOOKUP_TIMEOUT - _TMDB_QUIET_WAIT, 0)
+        if not wait([lookup], timeout=remaining).done:
+            lookup.cancel()
+            console.print(
+                "  [dim]TMDb lookup timed out, continuing without it[/]"
+            )
+            return False
+    if lookup.cancelled():
         return True
-    console.print("  [dim]Fetching metadata...[/]")
-    thread.join(timeout=10)
-    if thread.is_alive():
-        console.print(
-            "  [dim]TMDb lookup timed out, continuing without it[/]"
-        )
-        return False
+    try:
+        _apply_tmdb_match(disc_info, lookup.result())
+    except Exception:
+        logger.debug("TMDb lookup failed", exc_info=True)
     return True
 
 
+def _apply_tmdb_match(disc_info: DiscInfo, match: dict | None) -> None:
+    """Copy a TMDb movie match onto disc_info."""
+    if not match:
+        return
+    disc_info.tmdb_id = match.get("id")
+    title = match.get("title", "")
+    year = (match.get("release_date") or "")[:4]
+    disc_info.tmdb_title = title
+    if year:
+        disc_info.year = int(year)
+
+
 # ── Menu ─────────────────────────────────────────────────────────────
 
 _MENU_ITEMS = [
@@ -365,11 +394,17 @@ _MENU_ITEMS = [
 ]
 
 
+@functools.cache
+def _init_params(cls: type) -> frozenset[str]:
+    """Parameter names accepted by cls.__init__, introspected once."""
+    return frozenset(inspect.signature(cls.__init__).parameters)
+
+
 def _build_terminal_menu(
     entries: Sequence[str], **kwargs
 ) -> TerminalMenu:
     """Build a TerminalMenu while tolerating older library versions."""
-    supported = inspect.signature(TerminalMenu.__init__).parameters
+    supported = _init_params(TerminalMenu)
     compatible_kwargs = {
         key: value
         for key, value in kwargs.items()
@@ -380,9 +415,10 @@ def _build_terminal_menu(
 
 def _show_menu() -> int | None:
     """Show scrollable action menu. Returns index or None to quit."""
-    console.print("  [bold]What do you want to rip?[/]")
-    console.print()
+    console.print("  [bold]What do you want to rip?[/]\n")
 
+    # Built per call: a TerminalMenu keeps its search text and cursor
+    # between show() calls, so a reused one reopens filtered.
     menu = _build_terminal_menu(
         _MENU_ITEMS,
         title="  Enter to select. Esc to quit.",
@@ -419,33 +455,36 @@ def _suggested_name(disc_info: DiscInfo) -> str:
     return sanitize_filename(raw)
 
 
-def _prompt_movie_name(disc_info: DiscInfo) -> str | None:
-    """Prompt for movie name. Returns None to go back."""
-    suggested = _suggested_name(disc_info)
-    console.print()
+def _prompt(message: str, default: str = "") -> str | None:
+    """Read one stripped line for a prompt that supports going back.
+
+    Returns None on EOF, Ctrl+C or a back command, and default when the
+    answer is blank.
+    """
     try:
-        name = input(
-            f"  Movie name [{suggested}] (b=back): "
-        ).strip()
+        raw = input(message).strip()
     except (EOFError, KeyboardInterrupt):
         console.print()
         return None
-    if _is_back_command(name):
+    if _is_back_command(raw):
         return None
-    return name or suggested
+    return raw or default
+
+
+def _prompt_movie_name(disc_info: DiscInfo) -> str | None:
+    """Prompt for movie name. Returns None to go back."""
+    suggested = _suggested_name(disc_info)
+    console.print()
+    return _prompt(
+        f"  Movie name [{suggested}] (b=back): ", default=suggested,
+    )
 
 
 def _prompt_disc_count() -> int | None:
     """Prompt for number of discs."""
-    try:
-        raw = input("  Number of discs [2] (b=back): ").strip()
-    except (EOFError, KeyboardInterrupt):
-        console.print()
-        return None
-    if _is_back_command(raw):
+    raw = _prompt("  Number of discs [2] (b=back): ", default="2")
+    if raw is None:
         return None
-    if not raw:
-        return 2
     try:
         return int(raw)
     except ValueError:
@@ -462,34 +501,21 @@ def _prompt_tv_info(
         prompt = f"  Show name [{suggested_show}] (b=back): "
     else:
         prompt = "  Show name (b=back): "
-    try:
-        show = input(prompt).strip()
-    except (EOFError, KeyboardInterrupt):
-        console.print()
-        return None
-    if _is_back_command(show):
+    show = _prompt(prompt, default=suggested_show or "")
+    if show is None:
         return None
     if not show:
-        if suggested_show:
-            show = suggested_show
-        else:
-            console.print("  [red]Show name cannot be empty[/]")
-            return None
+        console.print("  [red]Show name cannot be empty[/]")
+        return None
 
-    try:
-        raw = input("  Season number [1] (b=back): ").strip()
-    except (EOFError, KeyboardInterrupt):
-        console.print()
+    raw = _prompt("  Season number [1] (b=back): ", default="1")
+    if raw is None:
         return None
-    if _is_back_command(raw):
+    try:
+        season = int(raw)
+    except ValueError:
+        console.print("  [red]Invalid season number[/]")
         return None
-    season = 1
-    if raw:
-        try:
-            season = int(raw)
-        except ValueError:
-            console.print("  [red]Invalid season number[/]")
-            return None
 
     return show, season
 
@@ -499,15 +525,10 @@ def _select_titles(disc_info: DiscInfo) -> set[int] | None:
     console.print()
 
     # Build menu entries with title details
-    entries: list[str] = []
-    for t in disc_info.titles:
-        marker = "*" if t.is_main_feature else " "
-        display = title_display_name(t)
-        entries.append(
-            f"{marker} {t.id:>2d}  {display[:35]:<35s}"
-            f"  {t.duration_display:>11s}"
-            f"  {t.size_display:>8s}"
-        )
+    entries = [
+        f"{'*' if t.is_main_feature else ' '} {t.id:>2d}  {_title_columns(t)}"
+        for t in disc_info.titles
+    ]
 
     # Pre-select main features
     preselected = [
@@ -538,22 +559,42 @@ def _select_titles(disc_info: DiscInfo) -> set[int] | None:
         return None
 
     # result is a tuple of selected indices
-    selected = set()
-    titles = disc_info.titles
     if isinstance(result, int):
-        selected.add(titles[result].id)
-    else:
-        for idx in result:
-            selected.add(titles[idx].id)
+        result = (result,)
+    titles = disc_info.titles
+    selected = {titles[idx].id for idx in result}
 
     if not selected:
         return None
     return selected
 
 
+def _title_columns(t: Title) -> str:
+    """Fixed-width name, duration and size columns for one title."""
+    return (
+        f"{title_display_name(t)[:35]:<35s}"
+        f"  {t.duration_display:>11s}  {t.size_display:>8s}"
+    )
+
+
 # ── Confirmation ─────────────────────────────────────────────────────
 
 
+# Longer title lists are shortened to their head and tail on confirm
+_CONFIRM_MAX_ROWS = 20
+_CONFIRM_HEAD_ROWS = 10
+_CONFIRM_TAIL_ROWS = 5
+
+# Mode line templates for _confirm_rip; unknown modes print as-is
+_MODE_LABELS = {
+    "full": "Movie with all extras",
+    "main": "Main feature only",
+    "multi": "Multi-disc movie ({disc_count} discs)",
+    "tv": "TV Season {season_num}",
+    "select": "Selected titles",
+}
+
+
 def _confirm_rip(
     disc_info: DiscInfo,
     name: str,
@@ -563,53 +604,41 @@ def _confirm_rip(
     selected_ids: set[int] | None = None,
 ) -> bool:
     """Print rip summary and ask for confirmation."""
-    mode_labels = {
-        "full": "Movie with all extras",
-        "main": "Main feature only",
-        "multi": f"Multi-disc movie ({disc_count} discs)",
-        "tv": f"TV Season {season_num}",
-        "select": "Selected titles",
-    }
-
     rip_titles = _get_titles(disc_info, mode, selected_ids)
-    rip_ids = {t.id for t in rip_titles}
-    total_size = sum(t.size_bytes for t in rip_titles)
-    total_dur = sum(t.duration_seconds for t in rip_titles)
-
-    console.print()
-    console.print(f"  [bold]Ready to rip: {name}[/]")
-    console.print(f"  Mode: {mode_labels.get(mode, mode)}")
-    console.print(
+    rip_ids: set[int] = set()
+    total_size = total_dur = 0
+    for t in rip_titles:
+        rip_ids.add(t.id)
+        total_size += t.size_bytes
+        total_dur += t.duration_seconds
+
+    header = [
+        "",
+        f"  [bold]Ready to rip: {name}[/]",
+        "  Mode: " + _MODE_LABELS.get(mode, mode).format(
+            disc_count=disc_count, season_num=season_num,
+        ),
         f"  Titles: {len(rip_titles)}"
         f" | ~{fmt_size(total_size)}"
-        f" | {fmt_duration(total_dur)}"
-    )
-    console.print()
-
-    for t in disc_info.titles:
-        selected = t.id in rip_ids
-        marker = "*" if selected else " "
-        display = title_display_name(t)
-        if selected:
-            console.print(
-                f"   {marker} {t.id:>2d}  {display[:35]:<35s}  "
-                f"{t.duration_display:>11s}  {t.size_display:>8s}"
-            )
-        else:
-            console.print(
-                f"   {marker} {t.id:>2d}  [dim]{display[:35]:<35s}  "
-                f"{t.duration_display:>11s}  {t.size_display:>8s}[/]"
-            )
-
-    console.print()
-    try:
-        answer = input("  Start rip? [Y/n/b]: ").strip().lower()
-    except (EOFError, KeyboardInterrupt):
-        console.print()
-        return False
-    if _is_back_command(answer):
+        f" | {fmt_duration(total_dur)}",
+        "",
+    ]
+    rows = [
+        f"   * {t.id:>2d}  {_title_columns(t)}" if t.id in rip_ids
+        else f"     {t.id:>2d}  [dim]{_title_columns(t)}[/]"
+        for t in disc_info.titles
+    ]
+    if len(rows) > _CONFIRM_MAX_ROWS:
+        hidden = len(rows) - _CONFIRM_HEAD_ROWS - _CONFIRM_TAIL_ROWS
+        rows[_CONFIRM_HEAD_ROWS:-_CONFIRM_TAIL_ROWS] = [
+            f"     [dim]… {hidden} more titles …[/]"
+        ]
+    # One print for the whole summary: a single lock and flush
+    console.print("\n".join([*header, *rows, ""]))
+    answer = _prompt("  Start rip? [Y/n/b]: ")
+    if answer is None:
         return False
-    return answer in ("", "y", "yes")
+    return answer.lower() in ("", "y", "yes")
 
 
 def _get_titles(
@@ -957,6 +986,9 @@ def run_batch(
             if disc_info is None:
                 break
 
+            # Kick off TMDb in background, overlapping the backup
+            tmdb_lookup = _start_tmdb_lookup(disc_info, settings)
+
             # Backup — with concurrent progress if remux is active
             if pending and pending.remux.is_alive():
                 console.print(
@@ -977,12 +1009,13 @@ def run_batch(
             # Re-scan from backup so title IDs match what makemkvcon
             # will use during remux.  Disc vs backup scans can assign
             # different indices to the same content.
-            disc_info = _scan_disc(settings, backup_dir=backup_dir)
-            if disc_info is None:
+            rescanned = _scan_disc(settings, backup_dir=backup_dir)
+            if rescanned is None:
                 console.print(
                     "  [red]Backup scan failed, skipping disc[/]"
                 )
                 continue
+            _adopt_rescan(disc_info, rescanned)
 
             enrich_disc_info(disc_info, backup_dir, settings)
 
@@ -1009,9 +1042,6 @@ def run_batch(
                     completed_backups.append(pending.backup_dir)
                 pending = None
 
-            # Kick off TMDb in background
-            tmdb_thread = _start_tmdb_lookup(disc_info, settings)
-
             # Interactive: show summary, menu, prompts
             _show_disc_summary(disc_info, verbose=verbose)
 
@@ -1027,7 +1057,8 @@ def run_batch(
                 break
 
             if choice != 5:
-                _await_tmdb(tmdb_thread)
+                _await_tmdb(tmdb_lookup, disc_info)
+                tmdb_lookup = None
 
             if choice == 5:
                 _show_disc_info(disc_info)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,16 +23,44 @@ from ripper.metadata.classifier import classify_extra
 from ripper.utils.formatting import fmt_duration, fmt_rate, fmt_size
 from ripper.utils.matching import find_title_for_mkv
 
-console = Console()
+# The one Console for the TUI; app and flows print through it too, so
+# output from any module cooperates with an active status or Live.
+# All styling is explicit markup, so Rich's auto-highlighter is off.
+console = Console(highlight=False)
 
 _BAR_WIDTH = 30
+# Every bar state, so a progress update indexes instead of building one
+_BARS = [
+    "\u2588" * filled + "\u2591" * (_BAR_WIDTH - filled)
+    for filled in range(_BAR_WIDTH + 1)
+]
+
+# print_progress skips a redraw that comes sooner than this after the
+# last one unless the percent moved at least _REDRAW_MIN_DELTA points
+_REDRAW_MIN_INTERVAL = 0.1
+_REDRAW_MIN_DELTA = 0.5
+_CLEAR_LINE = "\x1b[2K"
+
+_last_redraw_at = 0.0
+_last_redraw_percent = -1.0
+_last_redraw_title: str | None = None
+
+# Category names accepted by classify_extras_interactive
+_EXTRA_TYPES_BY_VALUE = {et.value: et for et in ExtraType}
+
+_CLASSIFY_HELP = "\n".join([
+    "",
+    "  [dim]Change: '<number> <category>' (e.g. '1 featurettes')[/]",
+    "  [dim]Categories: extras, behind the scenes, deleted scenes,[/]",
+    "  [dim]  featurettes, interviews, scenes, shorts, trailers[/]",
+    "  [dim]Press Enter to accept all.[/]",
+])
 
 
 def format_progress_line(progress: RipProgress) -> str:
     """Build the terminal progress line for a single update."""
     pct = progress.percent
-    filled = int(_BAR_WIDTH * pct / 100)
-    bar = "\u2588" * filled + "\u2591" * (_BAR_WIDTH - filled)
+    bar = _BARS[min(max(int(_BAR_WIDTH * pct / 100), 0), _BAR_WIDTH)]
     title = (progress.title_name or "Working")[:34]
 
     parts = [f"\r  {title:<34s} {bar}  {pct:5.1f}%"]
@@ -55,9 +84,26 @@ def format_progress_line(progress: RipProgress) -> str:
 
 
 def print_progress(progress: RipProgress) -> None:
-    """Print single-line progress update with carriage return."""
-    line = format_progress_line(progress)
-    sys.stdout.write(f"{line:<100s}")
+    """Print single-line progress update with carriage return.
+
+    Bursts of near-identical updates are coalesced so slow terminals
+    (SSH, serial) are not redrawn more than needed; 100% and title
+    changes are always shown.
+    """
+    global _last_redraw_at, _last_redraw_percent, _last_redraw_title
+    now = time.monotonic()
+    if (
+        progress.percent < 100.0
+        and progress.title_name == _last_redraw_title
+        and now - _last_redraw_at < _REDRAW_MIN_INTERVAL
+        and abs(progress.percent - _last_redraw_percent) < _REDRAW_MIN_DELTA
+    ):
+        return
+    _last_redraw_at = now
+    _last_redraw_percent = progress.percent
+    _last_redraw_title = progress.title_name
+
+    sys.stdout.write(_CLEAR_LINE + format_progress_line(progress))
     sys.stdout.flush()
 
 
@@ -66,8 +112,11 @@ def start_rip_with_status(
     rip_fn,
     *args,
     **kwargs,
-) -> None:
-    """Print a label and immediate progress line, then rip."""
+):
+    """Print a label and immediate progress line, then rip.
+
+    Returns whatever rip_fn returns.
+    """
     console.print()
     console.print(f"  [bold]{label}[/]")
     console.print("  [dim]Starting MakeMKV...[/]")
@@ -83,9 +132,10 @@ def start_rip_with_status(
                 eta_seconds=None,
             )
         )
-    rip_fn(*args, **kwargs)
+    result = rip_fn(*args, **kwargs)
     # Newline after the \r progress line
     console.print()
+    return result
 
 
 class ConcurrentProgress:
@@ -169,9 +219,7 @@ def classify_extras_interactive(
             message="Classify extras",
         ))
 
-    console.print()
-    console.print("  [bold]Classify extras for Emby:[/]")
-    console.print()
+    lines = ["", "  [bold]Classify extras for Emby:[/]", ""]
 
     # Build title lookup from disc_info for DiscDB names
     discdb_titles = {}
@@ -183,7 +231,10 @@ def classify_extras_interactive(
     discdb_title_list = list(discdb_titles.values())
 
     for i, path in enumerate(extras):
-        size = path.stat().st_size if path.exists() else 0
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
 
         # Try to match this file to a disc title with DiscDB info
         suggested = None
@@ -197,27 +248,14 @@ def classify_extras_interactive(
             suggested = classify_extra(path.stem)
 
         classifications[path] = suggested
-        console.print(
+        lines.append(
             f"  [cyan]{i + 1:>2d}[/]  {label[:40]:<40s}  "
             f"{fmt_size(size):>8s}  [dim][{suggested.value}][/]"
         )
 
-    console.print()
-    console.print(
-        "  [dim]Change: '<number> <category>'"
-        " (e.g. '1 featurettes')[/]"
-    )
-    console.print(
-        "  [dim]Categories: extras, behind the scenes,"
-        " deleted scenes,[/]"
-    )
-    console.print(
-        "  [dim]  featurettes, interviews, scenes,"
-        " shorts, trailers[/]"
-    )
-    console.print("  [dim]Press Enter to accept all.[/]")
-
-    valid_types = {et.value: et for et in ExtraType}
+    # The listing and help text go out in a single print
+    console.print("\n".join([*lines, _CLASSIFY_HELP]))
+
     extras_list = list(extras)
 
     while True:
@@ -248,12 +286,12 @@ def classify_extras_interactive(
             continue
 
         category = parts[1].lower()
-        if category not in valid_types:
+        if category not in _EXTRA_TYPES_BY_VALUE:
             console.print(f"  [red]Unknown category: {category}[/]")
             continue
 
         path = extras_list[idx - 1]
-        classifications[path] = valid_types[category]
+        classifications[path] = _EXTRA_TYPES_BY_VALUE[category]
         console.print(f"  [green]{idx} -> {category}[/]")
 
     return classifications
@@ -283,7 +321,12 @@ def _title_type_label(t: Title) -> str:
 def print_title_table(
     disc_info: DiscInfo, show_source: bool = False,
 ) -> None:
-    """Print title table using Rich."""
+    """Print title table using Rich.
+
+    The numeric columns get explicit widths taken from the values, so
+    Rich does not have to measure every one of their cells itself.
+    """
+    titles = disc_info.titles
     table = Table(show_header=True, padding=(0, 1))
     table.add_column("", width=1)
     table.add_column("ID", justify="right", width=3)
@@ -291,11 +334,17 @@ def print_title_table(
         table.add_column("Source", min_width=12)
     table.add_column("Name", min_width=30)
     table.add_column("Type", min_width=10)
-    table.add_column("Duration", justify="right")
-    table.add_column("Size", justify="right")
-    table.add_column("Ch", justify="right")
-
-    for t in disc_info.titles:
+    table.add_column("Duration", justify="right", width=max(
+        [len("Duration")] + [len(t.duration_display) for t in titles]
+    ))
+    table.add_column("Size", justify="right", width=max(
+        [len("Size")] + [len(t.size_display) for t in titles]
+    ))
+    table.add_column("Ch", justify="right", width=max(
+        [len("Ch")] + [len(str(t.chapter_count)) for t in titles]
+    ))
+
+    for t in titles:
         marker = "[bold]*[/]" if t.is_main_feature else ""
         row = [
             marker,
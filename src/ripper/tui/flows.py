@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
+import atexit
+import functools
 import logging
 import shutil
 import threading
@@ -13,8 +14,6 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ripper.notifications import NotificationDispatcher
 
-from rich.console import Console
-
 from ripper.config.settings import Settings
 from ripper.core.disc import DiscInfo, ExtraType, Title
 from ripper.core.organizer import (
@@ -35,17 +34,22 @@ from ripper.metadata.classifier import (
     classify_titles,
     detect_media_type,
 )
+from ripper.metadata.matcher import match_episodes_by_duration, match_title
+from ripper.metadata.tmdb import TMDbClient
 from ripper.tui.display import (
     classify_extras_interactive,
+    console,
     print_progress,
     start_rip_with_status,
 )
+from ripper.utils.aio import run_sync
 from ripper.utils.drive import eject_disc, wait_for_disc
-from ripper.utils.matching import find_title_for_mkv, match_title_id
+from ripper.utils.matching import find_titles_for_mkvs, match_title_id
 
 logger = logging.getLogger(__name__)
 
-console = Console()
+# Seconds a TMDb lookup may take before the TUI gives up and moves on
+TMDB_LOOKUP_TIMEOUT = 10.0
 
 
 # ── Backup Pipeline ────────────────────────────────────────────────
@@ -174,10 +178,13 @@ def remux_from_backup(
     label: str,
     settings: Settings,
     titles: list[Title] | None = None,
-) -> None:
-    """Remux all or specific titles from backup to staging dir."""
+) -> list[Path]:
+    """Remux all or specific titles from backup to staging dir.
+
+    Returns the MKV files written, largest first.
+    """
     if titles is not None:
-        start_rip_with_status(
+        return start_rip_with_status(
             f"Remuxing: {label}",
             remux_titles_from_backup,
             backup_dir,
@@ -186,15 +193,14 @@ def remux_from_backup(
             settings,
             on_progress=print_progress,
         )
-    else:
-        start_rip_with_status(
-            f"Remuxing: {label}",
-            remux_all_from_backup,
-            backup_dir,
-            staging,
-            settings,
-            on_progress=print_progress,
-        )
+    return start_rip_with_status(
+        f"Remuxing: {label}",
+        remux_all_from_backup,
+        backup_dir,
+        staging,
+        settings,
+        on_progress=print_progress,
+    )
 
 
 def cleanup_backup(staging_dir: Path) -> None:
@@ -264,6 +270,28 @@ def start_remux_background(
     return handle
 
 
+@functools.cache
+def shared_tmdb_client(api_key: str) -> TMDbClient:
+    """Return the process-wide TMDbClient for api_key.
+
+    Only use it from coroutines run via ripper.utils.aio: its session
+    belongs to that loop, and stays open (with its connection pool)
+    until exit.
+    """
+    client = TMDbClient(api_key)
+    atexit.register(_close_tmdb_client, client)
+    return client
+
+
+def _close_tmdb_client(client: TMDbClient) -> None:
+    try:
+        run_sync(client.close(), timeout=2)
+    except Exception:
+        logger.debug("TMDb client close failed", exc_info=True)
+    # Responses gathered this run are written once, here, not per request
+    client.cache.save()
+
+
 def _sync_discdb_lookup(content_hash: str) -> dict | None:
     """Synchronous DiscDB lookup."""
     from ripper.metadata.discdb import DiscDbClient
@@ -276,7 +304,7 @@ def _sync_discdb_lookup(content_hash: str) -> dict | None:
             await client.close()
 
     try:
-        return asyncio.run(_lookup())
+        return run_sync(_lookup())
     except Exception:
         logger.warning("DiscDB lookup failed", exc_info=True)
         return None
@@ -294,7 +322,7 @@ def _sync_discdb_url_lookup(url: str) -> dict | None:
             await client.close()
 
     try:
-        return asyncio.run(_lookup())
+        return run_sync(_lookup())
     except Exception:
         logger.warning("DiscDB URL lookup failed", exc_info=True)
         return None
@@ -307,12 +335,11 @@ def _match_mkvs_to_titles(
     mkvs: list[Path], titles: list[Title],
 ) -> dict[Path, Title]:
     """Match MKV files to disc titles by tXX pattern in filename."""
-    result: dict[Path, Title] = {}
-    for mkv in mkvs:
-        title = find_title_for_mkv(mkv, titles)
-        if title:
-            result[mkv] = title
-    return result
+    return {
+        mkv: title
+        for mkv, title in zip(mkvs, find_titles_for_mkvs(mkvs, titles))
+        if title
+    }
 
 
 def select_remux_titles(disc_info: DiscInfo) -> list[Title] | None:
@@ -327,13 +354,17 @@ def classify_and_organize_movie(
     name: str,
     staging: Path,
     dispatcher: NotificationDispatcher | None = None,
+    mkvs: list[Path] | None = None,
 ) -> None:
     """MKV finding, title matching, extras classification, and organize.
 
     This is the interactive post-remux step for movie-with-extras.
     Extracted so batch mode can call it after a background remux finishes.
+    Pass mkvs when the caller already knows what the remux wrote;
+    otherwise staging is listed.
     """
-    mkvs = find_mkv_files(staging)
+    if mkvs is None:
+        mkvs = find_mkv_files(staging)
 
     main_mkv = None
     extras_map: dict[Path, ExtraType] = {}
@@ -378,6 +409,7 @@ def classify_and_organize_movie(
         extras_map=extras_map,
         main_mkv=main_mkv,
         names_map=names_map,
+        mkvs=mkvs,
     )
 
 
@@ -392,13 +424,14 @@ def rip_movie_full(
     staging = settings.staging_dir / name
 
     titles = select_remux_titles(disc_info)
-    remux_from_backup(
+    mkvs = remux_from_backup(
         backup_dir, staging, name, settings, titles=titles,
     )
 
     classify_and_organize_movie(
         settings, disc_info, name, staging,
         dispatcher=dispatcher,
+        mkvs=mkvs,
     )
 
     if settings.auto_eject:
@@ -423,12 +456,12 @@ def rip_movie_main(
         console.print("  [red]No main feature detected[/]")
         return
 
-    remux_from_backup(
+    mkvs = remux_from_backup(
         backup_dir, staging, name, settings, titles=main_titles
     )
 
     console.print("  Organizing files...")
-    organize_movie(staging, name, settings)
+    organize_movie(staging, name, settings, mkvs=mkvs)
 
     if settings.auto_eject:
         eject_disc(settings.device)
@@ -485,10 +518,9 @@ def rip_multi_disc(
             except (EOFError, KeyboardInterrupt):
                 console.print("\n  [yellow]Cancelled.[/]")
                 return
-            console.print("  [dim]Waiting for disc...[/]")
-            if not wait_for_disc(
-                settings.device, timeout_seconds=120
-            ):
+            with console.status("  Waiting for disc...", spinner="dots"):
+                ready = wait_for_disc(settings.device, timeout_seconds=120)
+            if not ready:
                 console.print(
                     f"  [red]Timed out waiting for disc {d}[/]"
                 )
@@ -536,12 +568,11 @@ def rip_tv(
     """Rip TV episodes."""
     staging = settings.staging_dir / f"{show}-S{season:02d}"
 
-    remux_from_backup(
+    mkvs = remux_from_backup(
         backup_dir, staging, f"{show} Season {season}", settings
     )
 
     console.print("  Organizing episodes...")
-    mkvs = find_mkv_files(staging)
     episode_map = _match_tv_episodes(
         settings, disc_info, show, season, mkvs
     )
@@ -669,34 +700,26 @@ def _try_tmdb_episode_match(
     mkvs: list[Path],
 ) -> dict[Path, int] | None:
     """Try to match episodes using TMDb runtimes."""
-    from ripper.metadata.matcher import (
-        match_episodes_by_duration,
-        match_title,
-    )
-    from ripper.metadata.tmdb import TMDbClient
+    client = shared_tmdb_client(settings.tmdb_api_key)
 
     async def _lookup():
-        client = TMDbClient(settings.tmdb_api_key)
-        try:
-            results = await client.search_tv(show)
-            match = match_title(
-                show,
-                results,
-                title_key="name",
-                threshold=settings.fuzzy_threshold,
-            )
-            if not match:
-                return None
-            tv_id = match.get("id")
-            if not tv_id:
-                return None
-            return await client.get_season_episodes(
-                tv_id, season
-            )
-        finally:
-            await client.close()
+        results = await client.search_tv(show)
+        match = match_title(
+            show,
+            results,
+            title_key="name",
+            threshold=settings.fuzzy_threshold,
+        )
+        if not match:
+            return None
+        tv_id = match.get("id")
+        if not tv_id:
+            return None
+        return await client.get_season_episodes(
+            tv_id, season
+        )
 
-    episodes = asyncio.run(_lookup())
+    episodes = run_sync(_lookup(), timeout=TMDB_LOOKUP_TIMEOUT)
     if not episodes:
         return None
 
@@ -739,9 +762,8 @@ def _get_mkv_durations(
     disc_info: DiscInfo, mkvs: list[Path]
 ) -> list[tuple[int, int]]:
     """Get durations for MKV files from disc_info."""
-    durations: list[tuple[int, int]] = []
-    for i, mkv in enumerate(mkvs):
-        title = find_title_for_mkv(mkv, disc_info.titles)
-        dur = title.duration_seconds if title else 0
-        durations.append((i, dur))
-    return durations
+    titles = find_titles_for_mkvs(mkvs, disc_info.titles)
+    return [
+        (i, title.duration_seconds if title else 0)
+        for i, title in enumerate(titles)
+    ]
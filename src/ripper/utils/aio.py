@@ -0,0 +1,52 @@
+"""A long-lived event loop for running coroutines from blocking code."""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, starting its daemon thread on first use.
+
+    Coroutines submitted here share one loop for the life of the process,
+    so clients bound to it (aiohttp sessions) keep their connections.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="ripper-aio",
+                daemon=True,
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+    """Schedule coro on the shared loop and return a thread-safe future."""
+    return asyncio.run_coroutine_threadsafe(coro, background_loop())
+
+
+def run_sync(
+    coro: Coroutine[Any, Any, T], timeout: float | None = None,
+) -> T:
+    """Run coro on the shared loop and block until it finishes.
+
+    Raises:
+        TimeoutError: If timeout elapses first; coro is cancelled.
+    """
+    future = submit(coro)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
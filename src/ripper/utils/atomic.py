@@ -0,0 +1,25 @@
+"""Crash-safe file writes."""
+
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path so readers see either the old or new contents.
+
+    Writes to a per-process temp file beside path, fsyncs it, then
+    os.replace()s it into place, so a power loss cannot leave an empty
+    or truncated file under the new name. Use this for any state that
+    must survive an interrupted write (caches, session files). The temp
+    file is removed on failure and the error re-raised.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
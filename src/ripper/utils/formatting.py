@@ -4,6 +4,10 @@ import re
 
 _SMB_UNSAFE_RE = re.compile(r'[\\/:*?"<>|]')
 
+_KIB = 1 << 10
+_MIB = 1 << 20
+_GIB = 1 << 30
+
 
 def sanitize_filename(name: str) -> str:
     """Replace characters unsafe for SMB/Windows paths with hyphens."""
@@ -16,27 +20,26 @@ def sanitize_filename(name: str) -> str:
 
 def fmt_duration(seconds: int) -> str:
     """Format seconds as 'Xh XXm XXs'."""
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
     return f"{h}h {m:02d}m {s:02d}s"
 
 
 def fmt_size(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    if size_bytes >= 1_073_741_824:
-        return f"{size_bytes / 1_073_741_824:.1f} GB"
-    if size_bytes >= 1_048_576:
-        return f"{size_bytes / 1_048_576:.0f} MB"
+    if size_bytes >= _GIB:
+        return f"{size_bytes / _GIB:.1f} GB"
+    if size_bytes >= _MIB:
+        return f"{size_bytes / _MIB:.0f} MB"
     return f"{size_bytes} bytes"
 
 
 def fmt_rate(bytes_per_second: float) -> str:
     """Format transfer rate as human-readable string."""
-    if bytes_per_second >= 1_073_741_824:
-        return f"{bytes_per_second / 1_073_741_824:.1f} GB/s"
-    if bytes_per_second >= 1_048_576:
-        return f"{bytes_per_second / 1_048_576:.1f} MB/s"
-    if bytes_per_second >= 1024:
-        return f"{bytes_per_second / 1024:.0f} KB/s"
+    if bytes_per_second >= _GIB:
+        return f"{bytes_per_second / _GIB:.1f} GB/s"
+    if bytes_per_second >= _MIB:
+        return f"{bytes_per_second / _MIB:.1f} MB/s"
+    if bytes_per_second >= _KIB:
+        return f"{bytes_per_second / _KIB:.0f} KB/s"
     return f"{bytes_per_second:.0f} B/s"
@@ -5,26 +5,41 @@ from pathlib import Path
 from ripper.core.disc import Title
 
 
+def _title_id_patterns(title_id: int) -> tuple[str, str, str]:
+    """Filename fragments that identify title_id: t00, title00, title_0."""
+    return (f"t{title_id:02d}", f"title{title_id:02d}", f"title_{title_id}")
+
+
 def match_title_id(stem: str, title_id: int) -> bool:
     """Check if a lowercased filename stem matches a title ID pattern.
 
     Recognizes patterns: t00, title00, title_0
     """
     lower = stem.lower()
-    patterns = [
-        f"t{title_id:02d}",
-        f"title{title_id:02d}",
-        f"title_{title_id}",
-    ]
-    return any(p in lower for p in patterns)
+    return any(p in lower for p in _title_id_patterns(title_id))
 
 
 def find_title_for_mkv(
     mkv: Path, titles: list[Title],
 ) -> Title | None:
     """Find the matching Title for an MKV file by filename pattern."""
-    stem = mkv.stem
-    for title in titles:
-        if match_title_id(stem, title.id):
-            return title
-    return None
+    return find_titles_for_mkvs([mkv], titles)[0]
+
+
+def find_titles_for_mkvs(
+    mkvs: list[Path], titles: list[Title],
+) -> list[Title | None]:
+    """Find the matching Title for each MKV file by filename pattern.
+
+    Same rules as find_title_for_mkv, but each title's patterns are built
+    once for the whole batch. Returns one entry per MKV, in order.
+    """
+    patterns = [(_title_id_patterns(t.id), t) for t in titles]
+    found: list[Title | None] = []
+    for mkv in mkvs:
+        lower = mkv.stem.lower()
+        found.append(next(
+            (t for pats, t in patterns if any(p in lower for p in pats)),
+            None,
+        ))
+    return found
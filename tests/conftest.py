@@ -3,6 +3,24 @@
 import pytest
 
 from ripper.config.settings import Settings
+from ripper.metadata.tmdb import TMDbClient, _ResponseCache
+from ripper.tui import display
+
+
+@pytest.fixture(autouse=True)
+def _isolate_config_cache(tmp_path, monkeypatch):
+    """Keep the parsed-config cache out of the real home directory."""
+    monkeypatch.setattr(
+        Settings, "CONFIG_CACHE_PATH", tmp_path / "cache" / "config.pkl"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tmdb_cache(tmp_path, monkeypatch):
+    """Give each test an empty TMDb response cache under tmp_path."""
+    monkeypatch.setattr(
+        TMDbClient, "cache", _ResponseCache(path=tmp_path / "cache" / "tmdb.json")
+    )
 
 
 @pytest.fixture
@@ -15,3 +33,14 @@ def settings(tmp_path) -> Settings:
         device="/dev/null",
         tmdb_api_key="",
     )
+
+
+@pytest.fixture
+def printed(monkeypatch) -> list[str]:
+    """Capture what the TUI prints through its shared console."""
+    lines: list[str] = []
+    monkeypatch.setattr(
+        display.console, "print",
+        lambda *a, **k: lines.append(" ".join(a)),
+    )
+    return lines
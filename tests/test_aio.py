@@ -0,0 +1,49 @@
+"""Tests for the shared background event loop."""
+
+import asyncio
+
+import pytest
+
+from ripper.utils.aio import background_loop, run_sync, submit
+
+
+def test_run_sync_returns_result():
+    async def _add(a, b):
+        return a + b
+
+    assert run_sync(_add(2, 3)) == 5
+
+
+def test_coroutines_share_one_loop():
+    async def _current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_sync(_current_loop()) is run_sync(_current_loop())
+    assert run_sync(_current_loop()) is background_loop()
+
+
+def test_submit_propagates_exceptions():
+    async def _fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        submit(_fail()).result(timeout=5)
+
+
+def test_run_sync_timeout_cancels_coroutine():
+    cancelled = asyncio.Event()
+
+    async def _hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        run_sync(_hang(), timeout=0.05)
+
+    async def _wait_cancelled():
+        await asyncio.wait_for(cancelled.wait(), timeout=5)
+
+    run_sync(_wait_cancelled())
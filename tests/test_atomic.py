@@ -0,0 +1,53 @@
+"""Tests for crash-safe file writes."""
+
+import pytest
+
+from ripper.utils import atomic
+from ripper.utils.atomic import atomic_write_bytes
+
+
+def test_writes_and_replaces_contents(tmp_path):
+    target = tmp_path / "state.bin"
+    target.write_bytes(b"old")
+
+    atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_replace_keeps_old_contents(tmp_path, monkeypatch):
+    target = tmp_path / "state.bin"
+    target.write_bytes(b"old")
+
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(atomic.os, "replace", _fail)
+
+    with pytest.raises(OSError):
+        atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_syncs_temp_file_before_replacing(tmp_path, monkeypatch):
+    target = tmp_path / "state.bin"
+    calls: list[str] = []
+    real_fsync, real_replace = atomic.os.fsync, atomic.os.replace
+
+    def _fsync(fd):
+        calls.append("fsync")
+        real_fsync(fd)
+
+    def _replace(src, dst):
+        calls.append("replace")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(atomic.os, "fsync", _fsync)
+    monkeypatch.setattr(atomic.os, "replace", _replace)
+
+    atomic_write_bytes(target, b"new")
+
+    assert calls == ["fsync", "replace"]
@@ -2,6 +2,7 @@
 
 from ripper.core.disc import ExtraType, MediaType, Title
 from ripper.metadata.classifier import (
+    classify_and_detect,
     classify_extra,
     classify_titles,
     detect_media_type,
@@ -42,6 +43,10 @@ class TestClassifyExtra:
     def test_case_insensitive(self):
         assert classify_extra("BEHIND THE SCENES") == ExtraType.BEHIND_THE_SCENES
 
+    def test_earlier_pattern_wins_over_earlier_position(self):
+        result = classify_extra("Trailer: Behind the Scenes")
+        assert result == ExtraType.BEHIND_THE_SCENES
+
 
 def _make_title(duration_seconds: int, name: str = "Title") -> Title:
     return Title(
@@ -76,6 +81,11 @@ class TestDetectMediaType:
         titles = [_make_title(7200), _make_title(7800)]
         assert detect_media_type(titles) == MediaType.MOVIE
 
+    def test_medium_window_ends_at_min_main_length(self):
+        titles = [_make_title(2700), _make_title(2700), _make_title(2700)]
+        assert detect_media_type(titles, min_main_length=2400) == MediaType.MOVIE
+        assert detect_media_type(titles, min_main_length=3000) == MediaType.TV_SHOW
+
 
 class TestClassifyTitles:
     def test_main_feature_flagged(self):
@@ -93,3 +103,25 @@ class TestClassifyTitles:
         classify_titles(titles)
         assert titles[1].suggested_extra_type == ExtraType.BEHIND_THE_SCENES
         assert titles[2].suggested_extra_type == ExtraType.TRAILERS
+
+
+class TestClassifyAndDetect:
+    def test_matches_two_pass_result(self):
+        durations = [
+            (7200, "Feature"), (2530, "Behind the Scenes"), (150, "Trailer"),
+        ]
+        fused = [_make_title(d, n) for d, n in durations]
+        two_pass = [_make_title(d, n) for d, n in durations]
+
+        media_type = classify_and_detect(fused)
+        classify_titles(two_pass)
+
+        assert media_type == detect_media_type(two_pass) == MediaType.MOVIE
+        for a, b in zip(fused, two_pass, strict=True):
+            assert a.is_main_feature == b.is_main_feature
+            assert a.suggested_extra_type == b.suggested_extra_type
+
+    def test_episodes_detected_as_tv(self):
+        titles = [_make_title(2700, f"Episode {i}") for i in range(4)]
+        assert classify_and_detect(titles) == MediaType.TV_SHOW
+        assert not any(t.is_main_feature for t in titles)
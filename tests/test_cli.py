@@ -0,0 +1,55 @@
+"""Tests for the Typer CLI entry point."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_importing_cli_does_not_load_settings_or_core():
+    code = (
+        "import sys, ripper.cli; "
+        "print('pydantic_settings' in sys.modules, "
+        "'ripper.core.ripper' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False False"
+
+
+def test_get_settings_skips_validation_when_unconfigured(
+    tmp_path, monkeypatch,
+):
+    from ripper.cli import _get_settings
+    from ripper.config.settings import Settings
+
+    monkeypatch.setattr(Settings, "CONFIG_PATH", tmp_path / "missing.toml")
+    for key in list(os.environ):
+        if key.upper().startswith("RIPPER_"):
+            monkeypatch.delenv(key)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Settings() should not be validated")
+
+    monkeypatch.setattr(Settings, "__init__", _fail)
+
+    settings = _get_settings()
+
+    assert settings.device == "/dev/sr0"
+    assert settings.fuzzy_threshold == 75
+    assert settings.staging_dir == Path("/mnt/media/Rips-Staging")
+
+
+def test_get_settings_validates_when_env_is_set(tmp_path, monkeypatch):
+    from ripper.cli import _get_settings
+    from ripper.config.settings import Settings
+
+    monkeypatch.setattr(Settings, "CONFIG_PATH", tmp_path / "missing.toml")
+    monkeypatch.setenv("RIPPER_DEVICE", "/dev/sr7")
+
+    assert _get_settings().device == "/dev/sr7"
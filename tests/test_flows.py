@@ -11,6 +11,8 @@ from ripper.core.disc import DiscDbTitleInfo, DiscInfo, Title
 from ripper.tui.flows import (
     RemuxHandle,
     _apply_discdb_result,
+    _close_tmdb_client,
+    _sync_discdb_lookup,
     cleanup_backup,
     create_backup,
     enrich_disc_info,
@@ -418,3 +420,55 @@ class TestEnrichDiscInfoUrlFallback:
             enrich_disc_info(disc_info, backup_dir, settings)
 
         mock_url.assert_not_called()
+
+
+class TestSyncDiscdbLookup:
+    def test_runs_on_shared_loop_and_closes_client(self):
+        seen: dict = {}
+
+        class FakeDiscDbClient:
+            async def lookup_disc(self, content_hash):
+                seen["thread"] = threading.current_thread().name
+                return {"hash": content_hash}
+
+            async def close(self):
+                seen["closed"] = True
+
+        with patch(
+            "ripper.metadata.discdb.DiscDbClient", FakeDiscDbClient,
+        ):
+            assert _sync_discdb_lookup("ABC123") == {"hash": "ABC123"}
+
+        assert seen == {"thread": "ripper-aio", "closed": True}
+
+    def test_returns_none_on_error(self):
+        class FailingDiscDbClient:
+            async def lookup_disc(self, content_hash):
+                raise OSError("offline")
+
+            async def close(self):
+                pass
+
+        with patch(
+            "ripper.metadata.discdb.DiscDbClient", FailingDiscDbClient,
+        ):
+            assert _sync_discdb_lookup("ABC123") is None
+
+
+class TestCloseTmdbClient:
+    def test_closes_session_and_saves_cache_once(self):
+        calls: list[str] = []
+
+        class FakeCache:
+            def save(self):
+                calls.append("save")
+
+        class FakeClient:
+            cache = FakeCache()
+
+            async def close(self):
+                calls.append("close")
+
+        _close_tmdb_client(FakeClient())
+
+        assert calls == ["close", "save"]
@@ -69,6 +69,40 @@ class TestMatchTitle:
         assert result is not None
         assert result["id"] == 1
 
+    def test_prefers_sequel_over_subset_title(self):
+        candidates = [
+            {"title": "Dune", "id": 1},
+            {"title": "Dune: Part Two", "id": 2},
+        ]
+        result = match_title("Dune Part Two", candidates)
+        assert result is not None
+        assert result["id"] == 2
+
+    def test_ignores_case_and_punctuation(self):
+        candidates = [{"title": "Spider-Man: No Way Home", "id": 1}]
+        result = match_title("SPIDER MAN NO WAY HOME", candidates, threshold=95)
+        assert result is not None
+
+    def test_ties_keep_first_candidate(self):
+        candidates = [
+            {"title": "Dune", "id": 1},
+            {"title": "Dune", "id": 2},
+        ]
+        result = match_title("Dune", candidates)
+        assert result is not None
+        assert result["id"] == 1
+
+    def test_duplicate_titles_map_back_to_right_candidate(self):
+        candidates = [
+            {"title": "Heat", "id": 1},
+            {"title": "Dune", "id": 2},
+            {"title": "Heat", "id": 3},
+            {"title": "Dune Part Two", "id": 4},
+        ]
+        result = match_title("Dune Part Two", candidates)
+        assert result is not None
+        assert result["id"] == 4
+
 
 class TestMatchEpisodesByDuration:
     def test_exact_match(self):
@@ -3,7 +3,11 @@
 from pathlib import Path
 
 from ripper.core.disc import Title
-from ripper.utils.matching import find_title_for_mkv, match_title_id
+from ripper.utils.matching import (
+    find_title_for_mkv,
+    find_titles_for_mkvs,
+    match_title_id,
+)
 
 
 def _make_title(title_id: int, name: str = "Test") -> Title:
@@ -82,3 +86,16 @@ class TestFindTitleForMkv:
         result = find_title_for_mkv(mkv, titles)
         assert result is not None
         assert result.name == "First"
+
+
+class TestFindTitlesForMkvs:
+    def test_matches_find_title_for_mkv_per_file(self):
+        titles = [_make_title(0, "Intro"), _make_title(3, "Feature")]
+        mkvs = [
+            Path("/tmp/t03.mkv"),
+            Path("/tmp/unknown.mkv"),
+            Path("/tmp/B1_T00.mkv"),
+        ]
+        result = find_titles_for_mkvs(mkvs, titles)
+        assert result == [find_title_for_mkv(m, titles) for m in mkvs]
+        assert [t and t.id for t in result] == [3, None, 0]
@@ -48,12 +48,12 @@ def test_dispatcher_fans_out_to_all_notifiers():
         event_type=EventType.ACTION_NEEDED,
         message="choose mode",
     )
+    before = set(threading.enumerate())
     dispatcher.notify(event)
 
-    # Wait for daemon threads to finish
-    for t in threading.enumerate():
-        if t.daemon and t.is_alive():
-            t.join(timeout=2)
+    # Wait for the notifier threads to finish
+    for t in set(threading.enumerate()) - before:
+        t.join(timeout=2)
 
     notifier_a.send.assert_called_once_with(event)
     notifier_b.send.assert_called_once_with(event)
@@ -69,11 +69,11 @@ def test_failing_notifier_does_not_block_others():
         event_type=EventType.RIP_FAILED,
         message="oops",
     )
+    before = set(threading.enumerate())
     dispatcher.notify(event)
 
-    for t in threading.enumerate():
-        if t.daemon and t.is_alive():
-            t.join(timeout=2)
+    for t in set(threading.enumerate()) - before:
+        t.join(timeout=2)
 
     failing.send.assert_called_once_with(event)
     working.send.assert_called_once_with(event)
@@ -1,10 +1,20 @@
 """Tests for file organization into Emby structure."""
 
+import errno
+import subprocess
 from pathlib import Path
 
+import pytest
+
 from ripper.config.settings import Settings
+from ripper.core import organizer
 from ripper.core.disc import ExtraType
 from ripper.core.organizer import (
+    _fast_move,
+    _list_disc_mkvs,
+    _merge_segments,
+    _remove_if_empty,
+    find_mkv_files,
     organize_movie,
     organize_tv,
     reorganize_staging,
@@ -28,6 +38,132 @@ def _create_mkv(path: Path, size: int) -> Path:
     return path
 
 
+class TestFindMkvFiles:
+    def test_returns_nested_mkvs_largest_first(self, tmp_path):
+        small = _create_mkv(tmp_path / "a.mkv", 100)
+        large = _create_mkv(tmp_path / "sub" / "B.MKV", 300)
+        medium = _create_mkv(tmp_path / "sub" / "deep" / "c.mkv", 200)
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        assert find_mkv_files(tmp_path) == [large, medium, small]
+
+    def test_missing_root_returns_empty(self, tmp_path):
+        assert find_mkv_files(tmp_path / "missing") == []
+
+
+class TestListDiscMkvs:
+    def test_lists_discs_in_input_order(self, tmp_path):
+        discs = [tmp_path / f"Disc {i}" for i in range(1, 4)]
+        for i, disc in enumerate(discs, 1):
+            _create_mkv(disc / "main.mkv", 100 * i)
+            _create_mkv(disc / "extra.mkv", i)
+
+        result = _list_disc_mkvs(discs)
+
+        assert [mkvs[0].parent for mkvs in result] == discs
+        assert [mkvs[0].stat().st_size for mkvs in result] == [100, 200, 300]
+
+
+class TestFastMove:
+    def test_renames_within_filesystem(self, tmp_path):
+        src = _create_mkv(tmp_path / "a.mkv", 10)
+        dst = tmp_path / "out" / "b.mkv"
+        dst.parent.mkdir()
+
+        _fast_move(src, dst)
+
+        assert dst.stat().st_size == 10
+        assert not src.exists()
+
+    @pytest.mark.parametrize("code", [errno.EXDEV, errno.EPERM, errno.EACCES])
+    def test_falls_back_to_copy_when_rename_fails(
+        self, tmp_path, monkeypatch, code,
+    ):
+        src = _create_mkv(tmp_path / "a.mkv", 10)
+        dst = tmp_path / "b.mkv"
+
+        def _rename(a, b):
+            raise OSError(code, "rename failed")
+
+        # shutil.move also tries os.rename first, then copies
+        monkeypatch.setattr(organizer.os, "rename", _rename)
+
+        _fast_move(src, dst)
+
+        assert dst.exists()
+        assert not src.exists()
+
+    def test_other_errors_propagate(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _fast_move(tmp_path / "missing.mkv", tmp_path / "b.mkv")
+
+
+class TestMergeSegments:
+    def test_builds_append_command_and_removes_segments(
+        self, tmp_path, monkeypatch,
+    ):
+        segs = [_create_mkv(tmp_path / f"seg{i}.mkv", 1) for i in range(3)]
+        calls = []
+
+        def _run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            return subprocess.CompletedProcess(cmd, 0, stdout="")
+
+        monkeypatch.setattr(organizer.shutil, "which", lambda _: "/bin/mkvmerge")
+        monkeypatch.setattr(organizer.subprocess, "run", _run)
+
+        _merge_segments(segs, tmp_path, "Movie")
+
+        cmd, kwargs = calls[0]
+        assert cmd == [
+            "mkvmerge", "--quiet", "-o", str(tmp_path / "Movie.mkv"),
+            str(segs[0]), "+", str(segs[1]), "+", str(segs[2]),
+        ]
+        assert kwargs["stderr"] is subprocess.STDOUT
+        assert not any(seg.exists() for seg in segs)
+
+    def test_failure_falls_back_to_parts(self, tmp_path, monkeypatch):
+        segs = [_create_mkv(tmp_path / f"seg{i}.mkv", 1) for i in range(2)]
+        dest = tmp_path / "out"
+        dest.mkdir()
+
+        monkeypatch.setattr(organizer.shutil, "which", lambda _: "/bin/mkvmerge")
+        monkeypatch.setattr(
+            organizer.subprocess, "run",
+            lambda cmd, **kw: subprocess.CompletedProcess(
+                cmd, 2, stdout="Error: bad file",
+            ),
+        )
+
+        _merge_segments(segs, dest, "Movie")
+
+        assert (dest / "Movie - part1.mkv").exists()
+        assert (dest / "Movie - part2.mkv").exists()
+
+
+class TestRemoveIfEmpty:
+    def test_removes_nested_empty_dirs(self, tmp_path):
+        root = tmp_path / "staging"
+        (root / "a" / "b").mkdir(parents=True)
+
+        _remove_if_empty(root)
+
+        assert not root.exists()
+
+    def test_keeps_non_empty_dirs(self, tmp_path):
+        root = tmp_path / "staging"
+        (root / "empty").mkdir(parents=True)
+        _create_mkv(root / "full" / "a.mkv", 1)
+
+        _remove_if_empty(root)
+
+        assert not (root / "empty").exists()
+        assert (root / "full" / "a.mkv").exists()
+
+    def test_missing_path_is_ignored(self, tmp_path):
+        _remove_if_empty(tmp_path / "missing")
+
+
 class TestOrganizeMovie:
     def test_main_feature_placed_correctly(self, tmp_path):
         settings = _make_settings(tmp_path)
@@ -163,6 +299,18 @@ class TestOrganizeMovie:
         ).exists()
         assert not staging.exists()
 
+    def test_uses_given_mkvs_and_leaves_others(self, tmp_path):
+        settings = _make_settings(tmp_path)
+        staging = settings.staging_dir / "Test Movie (2024)"
+        main = _create_mkv(staging / "title00.mkv", 10000)
+        stale = _create_mkv(staging / "old_t05.mkv", 50000)
+
+        organize_movie(staging, "Test Movie (2024)", settings, mkvs=[main])
+
+        movie_dir = settings.movies_dir / "Test Movie (2024)"
+        assert (movie_dir / "Test Movie (2024).mkv").stat().st_size == 10000
+        assert stale.exists()
+
 
 class TestOrganizeTV:
     def test_episodes_named_correctly(self, tmp_path):
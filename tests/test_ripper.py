@@ -1,39 +1,55 @@
 """Tests for ripper progress parsing and process registry."""
 
+import io
 import subprocess
 import threading
 from unittest.mock import MagicMock
 
+import pytest
+
+from ripper.core import ripper
 from ripper.core.disc import Title
 from ripper.core.ripper import (
     HUMAN_PROGRESS_RE,
-    PROGRESS_RE,
     _active_processes,
+    _drain_output,
     _parse_human_progress_values,
-    _parse_progress_values,
+    _pick_progress_max,
     _process_lock,
+    _ProgressMailbox,
     _ProgressParser,
+    _snapshot_mkvs,
+    _split_prg_fields,
+    _written_mkvs,
     cancel_all_rips,
     cancel_rip,
 )
 
 
-def test_parse_progress_values_prefers_third_field_as_max():
-    match = PROGRESS_RE.match("PRGV:100,200,1000")
-    assert match is not None
-    assert _parse_progress_values(match) == (100, 1000)
+def test_pick_progress_max_prefers_third_field_as_max():
+    fields = _split_prg_fields("PRGV:100,200,1000")
+    assert fields is not None
+    assert _pick_progress_max(*map(int, fields)) == (100, 1000)
 
 
-def test_parse_progress_values_falls_back_to_second_field():
-    match = PROGRESS_RE.match("PRGV:100,1000,0")
-    assert match is not None
-    assert _parse_progress_values(match) == (100, 1000)
+def test_pick_progress_max_falls_back_to_second_field():
+    fields = _split_prg_fields("PRGV:100,1000,0")
+    assert fields is not None
+    assert _pick_progress_max(*map(int, fields)) == (100, 1000)
 
 
-def test_parse_progress_values_handles_no_denominator():
-    match = PROGRESS_RE.match("PRGV:100,0,0")
-    assert match is not None
-    assert _parse_progress_values(match) == (100, 0)
+def test_pick_progress_max_handles_no_denominator():
+    fields = _split_prg_fields("PRGV:100,0,0")
+    assert fields is not None
+    assert _pick_progress_max(*map(int, fields)) == (100, 0)
+
+
+def test_split_prg_fields_keeps_commas_in_the_third_field():
+    assert _split_prg_fields('PRGC:5018,0,"Saving, please wait"') == [
+        "5018", "0", '"Saving, please wait"',
+    ]
+    assert _split_prg_fields("PRGV:100,200") is None
+    assert _split_prg_fields("MSG:1005,0,1") is None
 
 
 def test_parse_human_progress_values_prefers_total_percent():
@@ -104,6 +120,38 @@ class TestProgressParser:
         assert parser.parse_line("") is None
         assert parser.parse_line("random text") is None
 
+    def test_prgc_name_may_contain_commas(self):
+        parser = _ProgressParser()
+        result = parser.parse_line('PRGC:2,0,"Saving, please wait"')
+        assert result is not None
+        assert result[0].title_name == "Saving, please wait"
+
+    def test_rejects_malformed_prgv_and_prgc(self):
+        parser = _ProgressParser()
+        assert parser.parse_line("PRGV:500,1000") is None
+        assert parser.parse_line("PRGV:abc,0,1000") is None
+        assert parser.parse_line("PRGV500,0,1000") is None
+        assert parser.parse_line("PRGC:3,0,Main Feature") is None
+
+    def test_skips_non_ascii_digit_fields(self):
+        parser = _ProgressParser()
+        assert parser.parse_line("PRGV:\u00b2,5,10") is None
+        assert parser.parse_line('PRGC:\u00b2,0,"Main Feature"') is None
+
+    def test_eta_is_recomputed_at_most_twice_per_second(self):
+        parser = _ProgressParser()
+        parser.start_time = 0.0
+
+        assert parser._throttled_eta(50.0, now=10.0) == 10
+        # Within the throttle window the previous ETA is reused
+        assert parser._throttled_eta(80.0, now=10.2) == 10
+        assert parser._throttled_eta(80.0, now=12.0) == 3
+
+    def test_returns_none_for_unknown_prg_kind(self):
+        parser = _ProgressParser()
+        assert parser.parse_line("PRGX:1,2,3") is None
+        assert parser.parse_line("PRG") is None
+
     def test_parses_human_action(self):
         parser = _ProgressParser()
         result = parser.parse_line(
@@ -199,6 +247,36 @@ class TestProcessRegistry:
                 _active_processes.pop("a", None)
                 _active_processes.pop("b", None)
 
+    def test_cancel_waits_without_holding_lock(self):
+        proc = self._make_mock_proc()
+        lock_held: list[bool] = []
+        proc.wait.side_effect = lambda timeout=None: lock_held.append(
+            _process_lock.locked()
+        )
+        with _process_lock:
+            _active_processes["slow"] = proc
+        try:
+            cancel_rip("slow")
+        finally:
+            with _process_lock:
+                _active_processes.pop("slow", None)
+
+        assert lock_held == [False]
+
+    def test_cancel_kills_after_timeout(self):
+        proc = self._make_mock_proc()
+        proc.wait.side_effect = subprocess.TimeoutExpired("makemkvcon", 5)
+        with _process_lock:
+            _active_processes["stuck"] = proc
+        try:
+            cancel_rip("stuck")
+        finally:
+            with _process_lock:
+                _active_processes.pop("stuck", None)
+
+        proc.terminate.assert_called_once()
+        proc.kill.assert_called_once()
+
     def test_concurrent_registration(self):
         """Verify multiple threads can register processes safely."""
         procs = [self._make_mock_proc() for _ in range(5)]
@@ -227,3 +305,87 @@ class TestProcessRegistry:
         # All should be cleaned up
         for i in range(5):
             assert f"concurrent-{i}" not in _active_processes
+
+
+class TestProgressDrain:
+    """Tests for the reader-thread handoff used by _run_makemkv."""
+
+    def test_coalesces_to_latest_update(self):
+        mailbox = _ProgressMailbox()
+        parser = _ProgressParser()
+        output = io.StringIO(
+            "MSG:1005,0,1,\"MakeMKV started\"\r\n"
+            "PRGV:100,0,1000\r\n"
+            "PRGV:500,0,1000\r\n"
+            "PRGV:900,0,1000\r\n"
+        )
+
+        _drain_output(output, parser, mailbox, None)
+        latest, closed = mailbox.take()
+
+        assert closed
+        assert latest is not None
+        assert latest[0].current_bytes == 900
+        assert latest[1] == "PRGV"
+        assert output.closed
+
+    def test_take_returns_none_after_close_without_updates(self):
+        mailbox = _ProgressMailbox()
+        mailbox.close()
+
+        assert mailbox.take() == (None, True)
+
+    def test_stops_makemkvcon_when_on_progress_raises(self, monkeypatch):
+        started: list[subprocess.Popen] = []
+        real_popen = subprocess.Popen
+
+        def _popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            started.append(proc)
+            return proc
+
+        def _boom(progress):
+            raise ValueError("render failed")
+
+        monkeypatch.setattr(ripper, "makemkvcon_path", lambda: "/bin/sh")
+        monkeypatch.setattr(ripper.subprocess, "Popen", _popen)
+        readers_before = set(threading.enumerate())
+
+        with pytest.raises(ValueError, match="render failed"):
+            ripper._run_makemkv(
+                ["makemkvcon", "-c", "echo PRGV:1,0,10; exec sleep 30"],
+                _boom,
+                process_id="raising",
+            )
+
+        assert started[0].poll() is not None
+        assert "raising" not in _active_processes
+        assert not [
+            t for t in set(threading.enumerate()) - readers_before
+            if t.name.startswith("makemkv-reader-")
+        ]
+
+
+class TestWrittenMkvs:
+    def test_skips_unchanged_leftovers(self, tmp_path):
+        (tmp_path / "stale.mkv").write_bytes(b"\x00" * 5)
+        before = _snapshot_mkvs(tmp_path)
+
+        (tmp_path / "title_t00.mkv").write_bytes(b"\x00" * 10)
+        (tmp_path / "title_t01.mkv").write_bytes(b"\x00" * 30)
+
+        assert _written_mkvs(tmp_path, before) == [
+            tmp_path / "title_t01.mkv",
+            tmp_path / "title_t00.mkv",
+        ]
+
+    def test_includes_overwritten_files(self, tmp_path):
+        (tmp_path / "title_t00.mkv").write_bytes(b"\x00" * 5)
+        before = _snapshot_mkvs(tmp_path)
+
+        (tmp_path / "title_t00.mkv").write_bytes(b"\x00" * 50)
+
+        assert _written_mkvs(tmp_path, before) == [tmp_path / "title_t00.mkv"]
+
+    def test_missing_dir_snapshot_is_empty(self, tmp_path):
+        assert _snapshot_mkvs(tmp_path / "missing") == {}
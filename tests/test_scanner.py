@@ -1,14 +1,63 @@
 """Tests for disc scanner output parsing."""
 
+import pytest
+
 from ripper.config.settings import Settings
+from ripper.core import scanner
 from ripper.core.scanner import (
+    MakeMKVNotFoundError,
     _compute_content_hash,
     _parse_duration,
     _parse_makemkv_output,
     _parse_raw_byte_count,
+    makemkvcon_path,
 )
 
 
+def _scan_settings(tmp_path) -> Settings:
+    """Settings with the main/extra length cutoffs the samples assume."""
+    return Settings(
+        staging_dir=tmp_path / "staging",
+        movies_dir=tmp_path / "movies",
+        tv_dir=tmp_path / "tv",
+        device="/dev/null",
+        tmdb_api_key="",
+        min_main_length=3600,
+        min_extra_length=30,
+    )
+
+
+class TestMakemkvconPath:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        makemkvcon_path.cache_clear()
+        yield
+        makemkvcon_path.cache_clear()
+
+    def test_resolves_once(self, monkeypatch):
+        calls: list[str] = []
+
+        def _which(name):
+            calls.append(name)
+            return "/usr/bin/makemkvcon"
+
+        monkeypatch.setattr(scanner.shutil, "which", _which)
+
+        assert makemkvcon_path() == "/usr/bin/makemkvcon"
+        assert makemkvcon_path() == "/usr/bin/makemkvcon"
+        assert calls == ["makemkvcon"]
+
+    def test_missing_binary_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(scanner.shutil, "which", lambda _: None)
+        with pytest.raises(MakeMKVNotFoundError):
+            makemkvcon_path()
+
+        monkeypatch.setattr(
+            scanner.shutil, "which", lambda _: "/opt/bin/makemkvcon",
+        )
+        assert makemkvcon_path() == "/opt/bin/makemkvcon"
+
+
 class TestParseDuration:
     def test_hours_minutes_seconds(self):
         assert _parse_duration("2:30:15") == 9015
@@ -22,6 +71,10 @@ class TestParseDuration:
     def test_short_duration(self):
         assert _parse_duration("0:00:05") == 5
 
+    def test_unexpected_shape_is_zero(self):
+        assert _parse_duration("1:02:03:04") == 0
+        assert _parse_duration("") == 0
+
 
 class TestParseRawByteCount:
     def test_numeric_string(self):
@@ -42,6 +95,12 @@ class TestParseRawByteCount:
     def test_non_numeric(self):
         assert _parse_raw_byte_count("no numbers") == 0
 
+    def test_surrounding_whitespace(self):
+        assert _parse_raw_byte_count(" 2048\n") == 2048
+
+    def test_signs_and_separators_are_dropped(self):
+        assert _parse_raw_byte_count("-1_024") == 1024
+
 
 class TestParseMakemkvOutput:
     """Test parsing of raw makemkvcon output."""
@@ -74,30 +133,19 @@ TINFO:3,10,0,"1048576"
 TINFO:3,11,0,"1048576"
 """
 
-    def _settings(self, tmp_path) -> Settings:
-        return Settings(
-            staging_dir=tmp_path / "staging",
-            movies_dir=tmp_path / "movies",
-            tv_dir=tmp_path / "tv",
-            device="/dev/null",
-            tmdb_api_key="",
-            min_main_length=3600,
-            min_extra_length=30,
-        )
-
     def test_disc_name_parsed(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         assert disc.name == "DUNE_PART_TWO"
 
     def test_title_count_excludes_short(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         # Title 3 (10s) is below min_extra_length (30s), so excluded
         assert len(disc.titles) == 3
 
     def test_main_feature_detected(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         main = [t for t in disc.titles if t.is_main_feature]
         assert len(main) == 1
@@ -105,7 +153,7 @@ TINFO:3,11,0,"1048576"
         assert main[0].duration_seconds == 9966  # 2h 46m 6s
 
     def test_extras_detected(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         extras = [t for t in disc.titles if not t.is_main_feature]
         assert len(extras) == 2
@@ -114,23 +162,48 @@ TINFO:3,11,0,"1048576"
         assert "Trailer" in names
 
     def test_title_sizes_parsed(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         main = disc.titles[0]
         assert main.size_bytes == 34474836992
 
     def test_chapter_counts(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         assert disc.titles[0].chapter_count == 18
         assert disc.titles[1].chapter_count == 8
 
     def test_no_hsh_lines_gives_no_content_hash(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_OUTPUT, settings)
         assert disc.content_hash is None
 
 
+class TestMakemkvInfoFeed:
+    def test_ignores_unrelated_lines_and_keeps_commas(self, tmp_path):
+        raw = (
+            'SINFO:0,1,2,0,"ignored"\n'
+            'MSG:1005,0,1,"MakeMKV started"\n'
+            'TINFO:0,2,0,"Dune, Part Two"\n'
+            'TINFO:0,27,0,"title_t00.mkv"\n'
+            'TINFO:0,9,0,"2:46:06"\n'
+        )
+        disc = _parse_makemkv_output(raw, _scan_settings(tmp_path))
+        assert [t.name for t in disc.titles] == ["Dune, Part Two"]
+
+    def test_raw_byte_count_wins_over_text_size_in_any_order(self, tmp_path):
+        raw = (
+            'TINFO:0,9,0,"2:00:00"\n'
+            'TINFO:0,11,0,"2048"\n'
+            'TINFO:0,10,0,"1.0 GB"\n'
+            'TINFO:1,9,0,"2:00:00"\n'
+            'TINFO:1,10,0,"1.0 GB"\n'
+            'TINFO:1,11,0,"4096"\n'
+        )
+        disc = _parse_makemkv_output(raw, _scan_settings(tmp_path))
+        assert [t.size_bytes for t in disc.titles] == [2048, 4096]
+
+
 class TestHshParsing:
     """Test HSH line parsing and content hash computation."""
 
@@ -145,27 +218,44 @@ TINFO:0,9,0,"2:46:06"
 TINFO:0,10,0,"34474836992"
 """
 
-    def _settings(self, tmp_path) -> Settings:
-        return Settings(
-            staging_dir=tmp_path / "staging",
-            movies_dir=tmp_path / "movies",
-            tv_dir=tmp_path / "tv",
-            device="/dev/null",
-            tmdb_api_key="",
-            min_main_length=3600,
-            min_extra_length=30,
-        )
-
     def test_content_hash_computed(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_WITH_HSH, settings)
         assert disc.content_hash is not None
         assert len(disc.content_hash) == 32
 
     def test_content_hash_matches_manual(self, tmp_path):
-        settings = self._settings(tmp_path)
+        settings = _scan_settings(tmp_path)
         disc = _parse_makemkv_output(self.SAMPLE_WITH_HSH, settings)
         expected = _compute_content_hash(
             [34474836992, 4513218560, 322122752]
         )
         assert disc.content_hash == expected
+
+
+class TestScanDisc:
+    def _fake_makemkvcon(self, tmp_path, monkeypatch, script: str) -> None:
+        exe = tmp_path / "makemkvcon"
+        exe.write_text("#!/bin/sh\n" + script)
+        exe.chmod(0o755)
+        monkeypatch.setattr(scanner, "makemkvcon_path", lambda: str(exe))
+
+    def test_streams_and_parses_output(self, tmp_path, monkeypatch):
+        sample = tmp_path / "info.txt"
+        sample.write_text(TestParseMakemkvOutput.SAMPLE_OUTPUT)
+        self._fake_makemkvcon(tmp_path, monkeypatch, f"cat {sample}\n")
+
+        disc = scanner.scan_disc(_scan_settings(tmp_path))
+
+        assert disc.name == "DUNE_PART_TWO"
+        assert len(disc.titles) == 3
+
+    def test_failure_without_output_reports_stderr(
+        self, tmp_path, monkeypatch,
+    ):
+        self._fake_makemkvcon(
+            tmp_path, monkeypatch, "echo 'no drive' >&2\nexit 1\n",
+        )
+
+        with pytest.raises(RuntimeError, match="no drive"):
+            scanner.scan_disc(_scan_settings(tmp_path))
@@ -135,3 +135,83 @@ def test_notification_env_var_overrides(tmp_path, monkeypatch):
     assert settings.notify_slack_webhook_url == (
         "https://hooks.slack.com/env"
     )
+
+
+def test_config_cache_is_reused_when_file_unchanged(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text('[ui]\ntheme = "light"\n')
+    monkeypatch.setattr(Settings, "CONFIG_PATH", config)
+
+    assert Settings().theme == "light"
+    assert Settings.CONFIG_CACHE_PATH.exists()
+
+    def _fail() -> dict:
+        raise AssertionError("TOML should not be re-parsed")
+
+    monkeypatch.setattr(Settings, "_parse_toml_settings", _fail)
+
+    assert Settings().theme == "light"
+
+
+def test_config_cache_invalidated_when_file_changes(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text('[ui]\ntheme = "light"\n')
+    monkeypatch.setattr(Settings, "CONFIG_PATH", config)
+    assert Settings().theme == "light"
+
+    config.write_text('[ui]\ntheme = "solarized"\n')
+
+    assert Settings().theme == "solarized"
+
+
+def test_config_cache_can_be_disabled(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text('[ui]\ntheme = "light"\n')
+    monkeypatch.setattr(Settings, "CONFIG_PATH", config)
+    monkeypatch.setenv("RIPPER_NO_CONFIG_CACHE", "1")
+
+    assert Settings().theme == "light"
+    assert not Settings.CONFIG_CACHE_PATH.exists()
+
+
+def test_corrupt_config_cache_falls_back_to_parsing(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text('[ui]\ntheme = "light"\n')
+    monkeypatch.setattr(Settings, "CONFIG_PATH", config)
+    Settings.CONFIG_CACHE_PATH.parent.mkdir(parents=True)
+    Settings.CONFIG_CACHE_PATH.write_bytes(b"not a pickle")
+
+    assert Settings().theme == "light"
+
+
+def test_flat_keys_and_device_section_override(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text(
+        """
+theme = "light"
+fuzzy_threshold = 90
+
+[device]
+path = "/dev/sr1"
+device = "/dev/sr2"
+""".strip()
+    )
+    monkeypatch.setattr(Settings, "CONFIG_PATH", config)
+
+    settings = Settings()
+
+    assert settings.theme == "light"
+    assert settings.fuzzy_threshold == 90
+    assert settings.device == "/dev/sr2"
+
+
+def test_schema_is_built_at_import():
+    # The validator is compiled when the class is defined. A forward
+    # reference would defer that to the first Settings() call.
+    assert Settings.__pydantic_complete__
+
+
+def test_flat_keys_cover_every_field():
+    from ripper.config.settings import _FLAT_KEYS
+
+    assert _FLAT_KEYS == set(Settings.model_fields)
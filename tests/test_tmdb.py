@@ -0,0 +1,91 @@
+"""Tests for the TMDb client."""
+
+import json
+import time
+
+from ripper.metadata.tmdb import TMDbClient, _ResponseCache
+
+
+class TestResponseCache:
+    def setup_method(self):
+        TMDbClient.cache.clear()
+
+    def teardown_method(self):
+        TMDbClient.cache.clear()
+
+    async def test_cached_response_skips_network(self):
+        client = TMDbClient("key")
+        TMDbClient.cache.put(
+            ("search/movie", frozenset({("query", "Dune")})),
+            {"results": [{"id": 1}]},
+        )
+
+        async def _no_session():
+            raise AssertionError("network should not be used")
+
+        client._get_session = _no_session
+
+        assert await client.search_movie("Dune") == [{"id": 1}]
+
+    def test_evicts_least_recently_used(self):
+        cache = _ResponseCache(max_entries=2)
+        cache.put(("a",), {"v": 1})
+        cache.put(("b",), {"v": 2})
+        cache.get(("a",))
+        cache.put(("c",), {"v": 3})
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == {"v": 1}
+
+    def test_expired_entries_are_dropped(self):
+        cache = _ResponseCache(ttl_seconds=-1)
+        cache.put(("a",), {"v": 1})
+
+        assert cache.get(("a",)) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "tmdb.json"
+        cache = _ResponseCache(path=path)
+        cache.put(("search/movie", frozenset({("query", "Dune")})), {"v": 1})
+        cache.save()
+
+        reloaded = _ResponseCache(path=path)
+        assert reloaded.get(
+            ("search/movie", frozenset({("query", "Dune")})),
+        ) == {"v": 1}
+
+    def test_put_does_not_write_until_saved(self, tmp_path):
+        path = tmp_path / "tmdb.json"
+        cache = _ResponseCache(path=path)
+        cache.put(("a",), {"v": 1})
+
+        assert not path.exists()
+        cache.save()
+        assert path.exists()
+
+    def test_expired_entries_are_dropped_on_load(self, tmp_path):
+        path = tmp_path / "tmdb.json"
+        path.write_text(json.dumps([
+            [["old"], time.time() - 100, {"v": 1}],
+            [["new"], time.time(), {"v": 2}],
+        ]))
+        cache = _ResponseCache(ttl_seconds=50, path=path)
+
+        assert cache.get(("old",)) is None
+        assert cache.get(("new",)) == {"v": 2}
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "tmdb.json"
+        path.write_bytes(b"not json")
+        cache = _ResponseCache(path=path)
+
+        assert cache.get(("a",)) is None
+        cache.put(("a",), {"v": 1})
+        cache.save()
+        assert _ResponseCache(path=path).get(("a",)) == {"v": 1}
+
+    def test_malformed_entries_are_ignored(self, tmp_path):
+        path = tmp_path / "tmdb.json"
+        path.write_text(json.dumps([[[{"not": "hashable"}], 1e12, {}]]))
+
+        assert _ResponseCache(path=path).get(("a",)) is None
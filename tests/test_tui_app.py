@@ -1,18 +1,46 @@
 """Tests for TUI app helpers."""
 
+import asyncio
+
+from ripper.core.disc import DiscInfo, MediaType, Title
 from ripper.core.ripper import RipProgress
-from ripper.tui import app
+from ripper.tui import app, display
 from ripper.tui.display import format_progress_line
 
 
+class FakeTerminalMenu:
+    """TerminalMenu stand-in that accepts only entries and a title."""
+
+    def __init__(self, entries, title=None):
+        self.entries = entries
+        self.title = title
+
+    def show(self):
+        return 0
+
+
+class FakeTMDbClient:
+    """shared_tmdb_client stand-in answering every search the same way."""
+
+    def __init__(self, results, delay=0.0):
+        self.results = results
+        self.delay = delay
+
+    async def search_movie(self, query):
+        await asyncio.sleep(self.delay)
+        return self.results
+
+
+def _use_tmdb(monkeypatch, settings, results, delay=0.0):
+    """Route TMDb lookups for settings through a FakeTMDbClient."""
+    client = FakeTMDbClient(results, delay)
+    monkeypatch.setattr(app, "shared_tmdb_client", lambda key: client)
+    settings.tmdb_api_key = "key"
+
+
 def test_build_terminal_menu_ignores_unsupported_kwargs(
     monkeypatch,
 ):
-    class FakeTerminalMenu:
-        def __init__(self, entries, title=None):
-            self.entries = entries
-            self.title = title
-
     monkeypatch.setattr(app, "TerminalMenu", FakeTerminalMenu)
 
     menu = app._build_terminal_menu(
@@ -77,3 +105,305 @@ def test_format_progress_line_shows_working_when_progress_title_updates():
 
     assert "Saving to MKV file" in line
     assert "Working..." in line
+
+
+def test_format_progress_line_keeps_bar_width_out_of_range():
+    def bar(percent):
+        progress = RipProgress(
+            title_id=1, title_name="Main", percent=percent,
+            current_bytes=0, total_bytes=0, eta_seconds=None,
+        )
+        line = format_progress_line(progress)
+        return "".join(c for c in line if c in "\u2588\u2591")
+
+    assert bar(0.0) == "\u2591" * 30
+    assert bar(50.0) == "\u2588" * 15 + "\u2591" * 15
+    assert bar(100.0) == "\u2588" * 30
+    assert bar(104.0) == "\u2588" * 30
+    assert bar(-1.0) == "\u2591" * 30
+
+
+def test_print_progress_coalesces_small_updates(monkeypatch, capsys):
+    clock = [1000.0]
+    monkeypatch.setattr(display.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(display, "_last_redraw_at", 0.0)
+    monkeypatch.setattr(display, "_last_redraw_percent", -1.0)
+    monkeypatch.setattr(display, "_last_redraw_title", None)
+
+    def _progress(percent, title="Main Feature"):
+        return RipProgress(
+            title_id=0, title_name=title, percent=percent,
+            current_bytes=0, total_bytes=0, eta_seconds=None,
+        )
+
+    def _drawn():
+        return capsys.readouterr().out.count("%")
+
+    display.print_progress(_progress(10.0))
+    assert _drawn() == 1
+    display.print_progress(_progress(10.2))  # too soon, too small
+    assert _drawn() == 0
+    display.print_progress(_progress(11.0))  # big enough jump
+    assert _drawn() == 1
+    display.print_progress(_progress(11.1, "Next Title"))
+    assert _drawn() == 1
+    display.print_progress(_progress(100.0, "Next Title"))
+    assert _drawn() == 1
+    clock[0] += 1.0
+    display.print_progress(_progress(100.0, "Next Title"))
+    assert _drawn() == 1
+
+
+def test_adopt_rescan_keeps_metadata_from_background_lookup():
+    disc_info = DiscInfo(name="DUNE", device="/dev/sr0", titles=[])
+    disc_info.tmdb_id = 693134
+    disc_info.tmdb_title = "Dune: Part Two"
+    rescanned = DiscInfo(
+        name="DUNE_BACKUP",
+        device="/dev/sr0",
+        titles=[Title(id=0, name="Main", duration_seconds=7200,
+                      size_bytes=1, chapter_count=1)],
+        content_hash="abc",
+        detected_media_type=MediaType.MOVIE,
+    )
+
+    app._adopt_rescan(disc_info, rescanned)
+
+    assert disc_info.titles is rescanned.titles
+    assert disc_info.content_hash == "abc"
+    assert disc_info.detected_media_type == MediaType.MOVIE
+    assert disc_info.tmdb_id == 693134
+    assert disc_info.tmdb_title == "Dune: Part Two"
+
+
+def test_tmdb_lookup_fills_disc_info_on_shared_loop(monkeypatch, settings):
+    _use_tmdb(monkeypatch, settings, [
+        {"id": 7, "title": "Heat", "release_date": "1995-12-15"},
+    ])
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    lookup = app._start_tmdb_lookup(disc_info, settings)
+
+    assert disc_info.tmdb_id is None  # applied by _await_tmdb, not the loop
+    assert app._await_tmdb(lookup, disc_info) is True
+    assert (disc_info.tmdb_id, disc_info.tmdb_title, disc_info.year) == (
+        7, "Heat", 1995,
+    )
+
+
+def test_tmdb_lookup_skipped_without_api_key(settings):
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+    assert app._start_tmdb_lookup(disc_info, settings) is None
+    assert app._await_tmdb(None, disc_info) is True
+
+
+def test_tmdb_lookup_times_out_without_touching_disc_info(
+    monkeypatch, settings,
+):
+    _use_tmdb(monkeypatch, settings, [
+        {"id": 7, "title": "Heat", "release_date": "1995"},
+    ], delay=60)
+    monkeypatch.setattr(app, "TMDB_LOOKUP_TIMEOUT", 0.05)
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    lookup = app._start_tmdb_lookup(disc_info, settings)
+
+    assert lookup.result(timeout=5) is None
+    assert app._await_tmdb(lookup, disc_info) is True
+    assert disc_info.tmdb_id is None
+
+
+def test_await_tmdb_timeout_cancels_lookup(monkeypatch):
+    monkeypatch.setattr(app, "TMDB_LOOKUP_TIMEOUT", 0.05)
+    lookup = app.submit(asyncio.sleep(60))
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    assert app._await_tmdb(lookup, disc_info) is False
+    assert lookup.cancelled()
+    assert app._await_tmdb(lookup, disc_info) is True
+    assert disc_info.tmdb_id is None
+
+
+def test_await_tmdb_logs_lookup_errors(monkeypatch, settings):
+    def _broken_match(*args, **kwargs):
+        raise ValueError("bad candidate")
+
+    _use_tmdb(monkeypatch, settings, [{"id": 7, "title": "Heat"}])
+    monkeypatch.setattr(app, "match_title", _broken_match)
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    lookup = app._start_tmdb_lookup(disc_info, settings)
+
+    assert app._await_tmdb(lookup, disc_info) is True
+    assert disc_info.tmdb_id is None
+
+
+def test_apply_tmdb_match_tolerates_null_release_date():
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    app._apply_tmdb_match(
+        disc_info, {"id": 7, "title": "Heat", "release_date": None},
+    )
+
+    assert (disc_info.tmdb_id, disc_info.tmdb_title, disc_info.year) == (
+        7, "Heat", None,
+    )
+
+
+def test_title_columns_are_fixed_width():
+    short = Title(id=1, name="Intro", duration_seconds=90,
+                  size_bytes=5 * 1024**2, chapter_count=1)
+    long = Title(id=2, name="A" * 60, duration_seconds=7200,
+                 size_bytes=30 * 1024**3, chapter_count=20)
+
+    assert len(app._title_columns(short)) == len(app._title_columns(long))
+    assert app._title_columns(long).startswith("A" * 35 + "  ")
+
+
+def test_confirm_rip_shortens_long_title_lists(monkeypatch, printed):
+    titles = [
+        Title(id=i, name=f"Episode {i}", duration_seconds=2700,
+              size_bytes=5 * 1024**3, chapter_count=5)
+        for i in range(30)
+    ]
+    disc_info = DiscInfo(name="SHOW", device="/dev/sr0", titles=titles)
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+
+    assert app._confirm_rip(disc_info, "Show", "tv") is True
+
+    listing = next(p for p in printed if "Episode 0" in p)
+    assert "Episode 9 " in listing
+    assert "Episode 10 " not in listing
+    assert "15 more titles" in listing
+    assert "Episode 25" in listing and "Episode 29" in listing
+
+
+def test_confirm_rip_prints_summary_once(monkeypatch, printed):
+    titles = [
+        Title(id=i, name=f"Title {i}", duration_seconds=600,
+              size_bytes=1024**3, chapter_count=3)
+        for i in range(3)
+    ]
+    disc_info = DiscInfo(name="DISC", device="/dev/sr0", titles=titles)
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+
+    assert app._confirm_rip(disc_info, "Disc", "full") is False
+
+    assert len(printed) == 1
+    assert "Ready to rip: Disc" in printed[0]
+    assert "Title 2" in printed[0]
+
+
+def test_confirm_rip_fills_mode_label(monkeypatch, printed):
+    disc_info = DiscInfo(name="SHOW", device="/dev/sr0", titles=[])
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+
+    app._confirm_rip(disc_info, "Show", "tv", season_num=3)
+    app._confirm_rip(disc_info, "Film", "multi", disc_count=2)
+
+    assert "Mode: TV Season 3" in printed[0]
+    assert "Mode: Multi-disc movie (2 discs)" in printed[1]
+
+
+def test_prompt_handles_default_back_and_eof(monkeypatch):
+    answers = iter(["", "  Heat  ", "b"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+
+    assert app._prompt("> ", default="Dune") == "Dune"
+    assert app._prompt("> ", default="Dune") == "Heat"
+    assert app._prompt("> ", default="Dune") is None
+
+    def _eof(prompt):
+        raise EOFError
+
+    monkeypatch.setattr("builtins.input", _eof)
+    assert app._prompt("> ") is None
+
+
+def test_prompt_tv_info_uses_defaults(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+
+    assert app._prompt_tv_info("The Wire") == ("The Wire", 1)
+    assert app._prompt_tv_info(None) is None
+
+
+def test_show_menu_builds_a_fresh_menu_each_time(monkeypatch):
+    built: list[FakeTerminalMenu] = []
+
+    def _menu(entries, **kwargs):
+        built.append(FakeTerminalMenu(entries, kwargs.get("title")))
+        return built[-1]
+
+    monkeypatch.setattr(app, "_build_terminal_menu", _menu)
+
+    assert app._show_menu() == 0
+    assert app._show_menu() == 0
+    assert [menu.entries for menu in built] == [app._MENU_ITEMS] * 2
+    assert built[0] is not built[1]
+
+
+def test_await_tmdb_is_silent_for_a_lookup_about_to_finish(printed):
+
+    async def _quick():
+        await asyncio.sleep(0.01)
+        return {"id": 7, "title": "Heat", "release_date": "1995-12-15"}
+
+    disc_info = DiscInfo(name="HEAT", device="/dev/sr0", titles=[])
+
+    assert app._await_tmdb(app.submit(_quick()), disc_info) is True
+    assert disc_info.tmdb_title == "Heat"
+    assert printed == []
+
+
+def test_tui_modules_share_one_console():
+    from ripper.tui import flows
+
+    assert app.console is display.console
+    assert flows.console is display.console
+
+
+def test_print_title_table_sizes_numeric_columns_to_fit(monkeypatch):
+    from rich.console import Console
+
+    recorder = Console(width=120, record=True, force_terminal=False)
+    monkeypatch.setattr(display, "console", recorder)
+    titles = [
+        Title(id=0, name="Feature", duration_seconds=40000,
+              size_bytes=12345, chapter_count=120),
+        Title(id=1, name="Short", duration_seconds=60,
+              size_bytes=2 * 1024**3, chapter_count=1),
+    ]
+
+    display.print_title_table(
+        DiscInfo(name="DISC", device="/dev/sr0", titles=titles),
+    )
+
+    row = next(
+        line for line in recorder.export_text().splitlines()
+        if "Feature" in line
+    )
+    assert "11h 06m 40s" in row
+    assert "12345 bytes" in row
+    assert "120" in row
+
+
+def test_classify_extras_lists_everything_in_one_print(
+    monkeypatch, tmp_path, printed,
+):
+    extras = [tmp_path / "a_t01.mkv", tmp_path / "trailer.mkv"]
+    for path in extras:
+        path.write_bytes(b"")
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+
+    result = display.classify_extras_interactive(extras)
+
+    assert set(result) == set(extras)
+    listing = printed[0]
+    assert "a_t01" in listing and "trailer" in listing
+    assert "Press Enter to accept all." in listing
+
+
+def test_console_leaves_unmarked_text_unstyled():
+    text = display.console.render_str("Timed out waiting for disc 2")
+
+    assert text.spans == []